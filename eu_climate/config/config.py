@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Dict
 import numpy as np
@@ -153,6 +154,12 @@ class ProjectConfig:
         self.smoothing_sigma = self.config["processing"]["smoothing_sigma"]
         self.target_crs = self.config["processing"]["target_crs"]
         self.target_resolution = self.config["processing"]["target_resolution"]
+        self.max_workers = (
+            self.config["processing"].get("max_workers") or os.cpu_count() or 1
+        )
+        self.spill_relevance_layers = self.config["processing"].get(
+            "spill_relevance_layers", False
+        )
 
         # Store GHS (Global Human Settlement) native resolution parameters
         # These are latitude-dependent due to the geographic coordinate system
@@ -217,6 +224,7 @@ class ProjectConfig:
         # Configure plot output settings
         self.figure_size = tuple(self.config["visualization"]["figure_size"])
         self.dpi = self.config["visualization"]["dpi"]
+        self.fast_png = self.config["visualization"].get("fast_png", True)
 
         # =================================================================
         # WEB EXPORT PARAMETERS
@@ -245,6 +253,10 @@ class ProjectConfig:
         # Coastline proximity risk
         self.coastline_risk = hazard_config.get("coastline_risk", {})
 
+        # Exported flood risk GeoTIFF encoding (float32, or opt-in uint8 with
+        # scale/offset)
+        self.quantize_hazard_exports = hazard_config.get("quantize_exports", False)
+
         # Log loaded hazard configuration for debugging
         logger.debug(f"Loaded river zones config: {self.river_zones}")
         logger.debug(f"Loaded river risk decay config: {self.river_risk_decay}")
@@ -9,7 +9,7 @@ import matplotlib.pyplot as plt
 from dataclasses import dataclass
 
 from eu_climate.config.config import ProjectConfig
-from eu_climate.utils.utils import setup_logging
+from eu_climate.utils.utils import read_scaled_band, setup_logging
 from eu_climate.utils.visualization import (
     ScientificStyle,
     setup_scientific_style,
@@ -1090,9 +1090,10 @@ class EconomicImpactAnalyzer:
         if not hazard_path.exists():
             raise FileNotFoundError(f"Hazard scenario not found: {hazard_path}")
 
-        # Load hazard data
+        # Load hazard data, decoding quantized exports to float risk so the
+        # threshold comparison runs on risk values rather than integer codes
         with rasterio.open(hazard_path) as src:
-            hazard_data = src.read(1).astype(np.float32)
+            hazard_data = read_scaled_band(src)
             meta = src.meta
 
         # Log hazard statistics
@@ -1,9 +1,11 @@
+import hashlib
+import json
 import rasterio
 import rasterio.features
 import rasterio.warp
 import geopandas as gpd
 from scipy import ndimage
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 import numpy as np
 from pathlib import Path
 import os
@@ -990,6 +992,7 @@ class ExpositionLayer(WebExportMixin):
         meta: dict,
         out_path: str,
         create_web_formats: bool = True,
+        tags: Optional[Dict[str, str]] = None,
     ):
         """
         Save the final exposition layer as GeoTIFF and web-optimized formats.
@@ -1002,6 +1005,7 @@ class ExpositionLayer(WebExportMixin):
             meta: Metadata dictionary with spatial reference information
             out_path: Output path for the GeoTIFF file
             create_web_formats: Whether to create web-optimized formats
+            tags: Optional additional GeoTIFF tags
 
         Returns:
             Dictionary indicating success of different export formats
@@ -1055,6 +1059,7 @@ class ExpositionLayer(WebExportMixin):
             output_path=out_path,
             layer_name=layer_name,
             create_web_formats=create_web_formats,
+            tags=tags,
         )
 
         if results.get("geotiff", False):
@@ -1166,6 +1171,57 @@ class ExpositionLayer(WebExportMixin):
         )
         return self.calculate_exposition_with_weights(weights)
 
+    def economic_exposition_key(self, weights: Dict[str, float]) -> str:
+        """
+        Get a key identifying an economic exposition layer's inputs.
+
+        The key covers the weights, the input datasets (path, size and
+        modification time) and the grid and processing settings, so a saved
+        layer tagged with it can only be reused while all of them match.
+
+        Args:
+            weights: Weights dictionary of the economic indicator
+
+        Returns:
+            Hex digest identifying the exposition layer inputs
+        """
+        input_paths = [
+            self.ghs_built_c_path,
+            self.ghs_built_v_path,
+            self.population_path,
+            self.electricity_consumption_path,
+            self.vierkant_stats_path,
+            self.ghs_duc_path,
+            self.gadm_l2_path,
+            self.port_path,
+            self.config.data_dir / "NUTS-L3-NL.shp",
+            self.config.land_mass_path,
+        ]
+        inputs = []
+        for path in input_paths:
+            path = Path(path)
+            stat = path.stat() if path.exists() else None
+            inputs.append(
+                [
+                    str(path),
+                    stat.st_size if stat else None,
+                    stat.st_mtime_ns if stat else None,
+                ]
+            )
+        key_source = {
+            "weights": weights,
+            "inputs": inputs,
+            "target_crs": self.config.target_crs,
+            "target_resolution": self.config.target_resolution,
+            "resampling_method": str(self.config.resampling_method),
+            "smoothing_sigma": self.config.smoothing_sigma,
+            "exposition_weights": self.config.exposition_weights,
+        }
+        return hashlib.blake2b(
+            json.dumps(key_source, sort_keys=True, default=str).encode(),
+            digest_size=12,
+        ).hexdigest()
+
     def save_economic_exposition_layers(self):
         """
         Create and save all economic-specific exposition layers based on config.
@@ -1195,7 +1251,12 @@ class ExpositionLayer(WebExportMixin):
 
             # Save TIF file
             tif_path = tif_output_dir / f"exposition_{economic_identifier}.tif"
-            self.save_exposition_layer(exposition_data, meta, str(tif_path))
+            self.save_exposition_layer(
+                exposition_data,
+                meta,
+                str(tif_path),
+                tags={"exposition_key": self.economic_exposition_key(weights)},
+            )
             logger.info(
                 f"Saved {economic_identifier} exposition layer TIF to {tif_path}"
             )
@@ -1521,7 +1582,12 @@ class ExpositionLayer(WebExportMixin):
         tif_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Save the TIF file
-        self.save_exposition_layer(exposition_data, meta, str(tif_path))
+        self.save_exposition_layer(
+            exposition_data,
+            meta,
+            str(tif_path),
+            tags={"exposition_key": self.economic_exposition_key(weights)},
+        )
         logger.info(
             f"Created and saved economic exposition layer for {economic_identifier} at {tif_path}"
         )
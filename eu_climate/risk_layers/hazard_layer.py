@@ -1,15 +1,22 @@
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import multiprocessing
+import operator
+import tempfile
+from typing import Callable, Dict, List, Optional, Tuple
 from matplotlib import pyplot as plt
+from matplotlib.colors import LinearSegmentedColormap
 import numpy as np
 import rasterio
 import rasterio.features
+import rasterio.transform
 import rasterio.warp
+import rasterio.windows
 import geopandas as gpd
 from scipy import ndimage
 from dataclasses import dataclass
 import pandas as pd
 from eu_climate.config.config import ProjectConfig
-from eu_climate.utils.utils import setup_logging
+from eu_climate.utils.utils import load_spilled_arrays, setup_logging, spill_arrays
 from eu_climate.utils.conversion import RasterTransformer
 from eu_climate.utils.visualization import LayerVisualizer
 from eu_climate.utils.normalise_data import (
@@ -20,6 +27,188 @@ from eu_climate.utils.normalise_data import (
 
 logger = setup_logging(__name__)
 
+# Flood risk colormap (warm colors for risk) and its RGBA lookup table, built
+# once so scenario panels colorize risk with a plain array lookup
+FLOOD_RISK_CMAP = LinearSegmentedColormap.from_list(
+    "flood_risk",
+    ["#ffffcc", "#feb24c", "#fd8d3c", "#fc4e2a", "#e31a1c", "#b10026"],
+    N=256,
+)
+FLOOD_RISK_LUT = FLOOD_RISK_CMAP(np.linspace(0, 1, 256)).astype(np.float32)
+
+# Upper bounds of the no/low/moderate risk classes used in summary statistics
+RISK_LEVEL_THRESHOLDS = (0.1, 0.3, 0.7)
+
+# Column order of the hazard assessment summary CSV
+SUMMARY_COLUMNS = (
+    "scenario",
+    "sea_level_rise_m",
+    "total_area_km2",
+    "high_risk_area_km2",
+    "moderate_risk_area_km2",
+    "low_risk_area_km2",
+    "high_risk_percentage",
+    "moderate_risk_percentage",
+    "low_risk_percentage",
+    "mean_risk",
+    "max_risk",
+    "description",
+)
+
+# uint8 encoding of exported flood risk GeoTIFFs: risk = value / LEVELS
+HAZARD_EXPORT_LEVELS = 254
+HAZARD_EXPORT_NODATA = 255
+
+
+def _render_hazard_scenario_png(config: ProjectConfig, render_kwargs: Dict) -> None:
+    """
+    Render a single hazard scenario PNG in a worker process.
+
+    Args:
+        config: Project configuration used to build the visualizer
+        render_kwargs: Keyword arguments for LayerVisualizer.visualize_hazard_scenario,
+            with arrays passed as spill_arrays references
+    """
+    import matplotlib
+
+    # Worker processes only write files, so force the non-interactive backend
+    matplotlib.use("Agg")
+    LayerVisualizer(config).visualize_hazard_scenario(
+        **load_spilled_arrays(render_kwargs)
+    )
+
+
+def _blocked_reduce(
+    arrays: Tuple[np.ndarray, ...],
+    reduce_block: Callable,
+    combine: Callable,
+    initial,
+    block_size: int = 1 << 20,
+):
+    """Fold reduce_block over aligned fixed-size blocks of the flattened arrays."""
+    flat_arrays = [array.reshape(-1) for array in arrays]
+    result = initial
+    for start in range(0, flat_arrays[0].size, block_size):
+        blocks = [flat[start : start + block_size] for flat in flat_arrays]
+        result = combine(result, reduce_block(*blocks))
+    return result
+
+
+def _count_above(values: np.ndarray, threshold: float) -> int:
+    """Count values strictly greater than a threshold, block by block."""
+    return _blocked_reduce(
+        (values,), lambda block: np.count_nonzero(block > threshold), operator.add, 0
+    )
+
+
+def _count_study_area(
+    dem_data: np.ndarray, nuts_mask: np.ndarray, land_mask: np.ndarray
+) -> int:
+    """Count valid DEM pixels inside the NUTS and land masks, block by block."""
+    return _blocked_reduce(
+        (dem_data, nuts_mask, land_mask),
+        lambda dem, nuts, land: np.count_nonzero(
+            np.logical_and(np.logical_and(~np.isnan(dem), nuts), land)
+        ),
+        operator.add,
+        0,
+    )
+
+
+def _block_risk_statistics(
+    risk: np.ndarray, valid: np.ndarray, thresholds: Tuple[float, ...]
+) -> Tuple[int, Tuple[int, ...], float, float]:
+    """Valid count, counts above each threshold, valid sum and valid max of a block."""
+    return (
+        np.count_nonzero(valid),
+        tuple(np.count_nonzero(risk > threshold) for threshold in thresholds),
+        float(np.add.reduce(risk, dtype=np.float64, where=valid)),
+        float(np.maximum.reduce(risk, where=valid, initial=-np.inf)),
+    )
+
+
+def _combine_risk_statistics(first: Tuple, second: Tuple) -> Tuple:
+    """Combine the risk statistics of two blocks."""
+    return (
+        first[0] + second[0],
+        tuple(a + b for a, b in zip(first[1], second[1])),
+        first[2] + second[2],
+        max(first[3], second[3]),
+    )
+
+
+def _risk_statistics(
+    flood_risk: np.ndarray,
+    valid_source: np.ndarray,
+    thresholds: Tuple[float, ...],
+    is_valid: Optional[Callable] = None,
+) -> Tuple[int, Tuple[int, ...], float, float]:
+    """Reduce a risk raster to valid count, threshold counts, valid sum and max."""
+    return _blocked_reduce(
+        (flood_risk, valid_source),
+        lambda risk, source: _block_risk_statistics(
+            risk, is_valid(source) if is_valid else source, thresholds
+        ),
+        _combine_risk_statistics,
+        (0, (0,) * len(thresholds), 0.0, -np.inf),
+    )
+
+
+def _summarize_flood_scenario(scenario_name: str, flood_data: Dict) -> Tuple:
+    """
+    Calculate the summary statistics row for a single flood scenario.
+
+    Args:
+        scenario_name: Name of the scenario
+        flood_data: Dictionary containing flood risk, DEM and scenario metadata
+
+    Returns:
+        Row of risk level areas, percentages and risk statistics ordered as
+        SUMMARY_COLUMNS
+    """
+    flood_risk = flood_data["flood_risk"]
+    scenario = flood_data["scenario"]
+
+    # Risk is zero outside the study area, so class counts over the whole
+    # raster equal those over valid pixels. Counting pixels above each
+    # threshold and differencing gives the (0.1, 0.3], (0.3, 0.7] and
+    # (0.7, 1] classes without a compacted copy of the valid risk values.
+    valid_pixels, above_counts, risk_sum, max_risk = _risk_statistics(
+        flood_risk,
+        flood_data["dem_data"],
+        RISK_LEVEL_THRESHOLDS,
+        is_valid=lambda dem: ~np.isnan(dem),
+    )
+
+    # Calculate areas for different risk levels
+    pixel_area_km2 = HazardLayer.PIXEL_AREA_KM2
+    total_valid_area_km2 = valid_pixels * pixel_area_km2
+    low_risk_area_km2 = (above_counts[0] - above_counts[1]) * pixel_area_km2
+    moderate_risk_area_km2 = (above_counts[1] - above_counts[2]) * pixel_area_km2
+    high_risk_area_km2 = above_counts[2] * pixel_area_km2
+
+    # Mean and maximum risk over the valid pixels
+    if valid_pixels > 0:
+        mean_risk = risk_sum / valid_pixels
+    else:
+        mean_risk = 0.0
+        max_risk = 0.0
+
+    return (
+        scenario_name,
+        scenario.rise_meters,
+        total_valid_area_km2,
+        high_risk_area_km2,
+        moderate_risk_area_km2,
+        low_risk_area_km2,
+        (high_risk_area_km2 / total_valid_area_km2) * 100,
+        (moderate_risk_area_km2 / total_valid_area_km2) * 100,
+        (low_risk_area_km2 / total_valid_area_km2) * 100,
+        mean_risk,
+        max_risk,
+        scenario.description,
+    )
+
 
 @dataclass
 class SeaLevelScenario:
@@ -113,6 +302,12 @@ class HazardLayer:
     with immediate export capabilities for memory-efficient handling of large datasets.
     """
 
+    # Area of one 30 m grid cell in km²
+    PIXEL_AREA_KM2 = (30 * 30) / 1_000_000
+
+    # Consistent scenario colors: SeaGreen, DarkOrange, Crimson, BlueViolet
+    SCENARIO_PALETTE = ("#2e8b57", "#ff8c00", "#dc143c", "#8a2be2")
+
     def __init__(self, config: ProjectConfig):
         """
         Initialize the Hazard Layer with project configuration.
@@ -128,9 +323,27 @@ class HazardLayer:
         self.river_polygons_path = self.config.river_polygons_path
         self.scenarios = SeaLevelScenario.get_default_scenarios()
 
+        # Resampling method name passed to raster transformation and alignment
+        self._resampling = (
+            self.config.resampling_method.name.lower()
+            if hasattr(self.config.resampling_method, "name")
+            else str(self.config.resampling_method).lower()
+        )
+
         # Initialize river polygon network (loaded later)
         self.river_polygon_network = None
 
+        # Burn shapes for the NUTS study area, built when boundaries are loaded
+        self._nuts_shapes = None
+
+        # Memoized NUTS boundaries and aligned land masks shared across methods
+        self._nuts_gdf = None
+        self._nuts_mask_cache = {}
+        self._land_mask_cache = {}
+
+        # Scenario-independent flood rasters, shared by all sea level scenarios
+        self._scenario_invariant_cache = {}
+
         # Initialize raster transformer for coordinate system handling
         self.transformer = RasterTransformer(
             target_crs=self.config.target_crs, config=self.config
@@ -169,7 +382,7 @@ class HazardLayer:
             - DEM data array: Elevation values in target CRS and resolution
             - Affine transform: Spatial reference transformation matrix
             - Coordinate Reference System: CRS object for spatial operations
-            - Land mass mask: Binary array (1=land, 0=water)
+            - Land mass mask: Boolean array (True=land, False=water)
         """
         logger.info("Loading DEM data...")
 
@@ -181,18 +394,14 @@ class HazardLayer:
         dem_data, transform, crs = self.transformer.transform_raster(
             self.dem_path,
             reference_bounds=reference_bounds,
-            resampling_method=self.config.resampling_method.name.lower()
-            if hasattr(self.config.resampling_method, "name")
-            else str(self.config.resampling_method).lower(),
+            resampling_method=self._resampling,
         )
 
         # Load and align land mass raster to DEM grid using same bounds
         land_mass_data, land_transform, _ = self.transformer.transform_raster(
             self.config.land_mass_path,
             reference_bounds=reference_bounds,
-            resampling_method=self.config.resampling_method.name.lower()
-            if hasattr(self.config.resampling_method, "name")
-            else str(self.config.resampling_method).lower(),
+            resampling_method=self._resampling,
         )
 
         # Ensure land mass data is aligned with DEM
@@ -204,13 +413,11 @@ class HazardLayer:
                 land_transform,
                 transform,
                 dem_data.shape,
-                self.config.resampling_method.name.lower()
-                if hasattr(self.config.resampling_method, "name")
-                else str(self.config.resampling_method).lower(),
+                self._resampling,
             )
 
-        # Create binary land mask (1=land, 0=water)
-        land_mask = (land_mass_data > 0).astype(np.uint8)
+        # Create boolean land mask (True=land, False=water)
+        land_mask = land_mass_data > 0
 
         # Calculate spatial resolution in meters for reporting
         res_x = abs(transform[0])  # Width of a pixel in meters
@@ -316,7 +523,7 @@ class HazardLayer:
             dem_data: Digital elevation model data array
             sea_level_rise: Sea level rise in meters for the scenario
             transform: Affine transform matrix for spatial reference
-            land_mask: Binary land mask (1=land, 0=water)
+            land_mask: Boolean land mask (True=land, False=water)
 
         Returns:
             Normalized array where values range from 0 (no risk) to 1 (maximum risk)
@@ -332,19 +539,12 @@ class HazardLayer:
                 "Could not load NUTS boundaries - required for flood extent calculation"
             )
 
-        # Create mask for valid land areas (non-NaN DEM values)
-        valid_land_mask = ~np.isnan(dem_data)
-
-        # Always rasterize NUTS to DEM grid for study area definition
-        nuts_mask = rasterio.features.rasterize(
-            [(geom, 1) for geom in nuts_gdf.geometry],
-            out_shape=dem_data.shape,
-            transform=transform,
-            dtype=np.uint8,
+        # Study area and river/coastline enhancements do not depend on the
+        # sea level rise, so they are computed once and shared by all scenarios
+        invariant_layers = self._get_scenario_invariant_layers(
+            dem_data, transform, land_mask
         )
-
-        # Define valid study area combining land, NUTS, and data availability
-        valid_study_area = valid_land_mask & (nuts_mask == 1) & (land_mask == 1)
+        valid_study_area = invariant_layers["valid_study_area"]
 
         # Step 1: Calculate base elevation-based flood risk
         elevation_risk = self._calculate_elevation_flood_risk(
@@ -367,17 +567,11 @@ class HazardLayer:
             river_decay_enhanced_risk, dem_data, elevation_stats, valid_study_area
         )
 
-        # Step 4: Calculate river risk enhancement zones
-        river_risk_enhancement = self._calculate_river_risk_enhancement(
-            dem_data.shape, transform
-        )
+        # Step 4: River risk enhancement zones
+        river_risk_enhancement = invariant_layers["river_risk_enhancement"]
 
-        # Step 5: Calculate coastline risk enhancement zones
-        coastline_risk_enhancement, coastline_zone_mask = (
-            self._calculate_coastline_risk_enhancement(
-                dem_data.shape, transform, land_mask
-            )
-        )
+        # Step 5: Coastline risk enhancement zones
+        coastline_risk_enhancement = invariant_layers["coastline_risk_enhancement"]
 
         # Step 6: Combine all risk factors
         combined_risk = self._combine_flood_risks(
@@ -407,24 +601,25 @@ class HazardLayer:
         pixel_height_avg = (pixel_height_top + pixel_height_bottom) / 2
         pixel_area_m2 = pixel_width * pixel_height_avg
 
-        # Calculate risk area statistics
-        valid_pixels = np.int64(np.sum(valid_study_area))
-        high_risk_pixels = np.int64(np.sum((final_risk > 0.7) & valid_study_area))
-        moderate_risk_pixels = np.int64(
-            np.sum((final_risk > 0.3) & (final_risk <= 0.7) & valid_study_area)
-        )
-        low_risk_pixels = np.int64(
-            np.sum((final_risk > 0.1) & (final_risk <= 0.3) & valid_study_area)
+        # Calculate risk area statistics. The normalized risk is zero outside
+        # the study area, so the compound '> low & <= high' class masks reduce
+        # to differences of blockwise counts above each threshold, computed in
+        # the same scan as the valid-pixel sum and maximum.
+        valid_pixels, above_counts, risk_sum, risk_max = _risk_statistics(
+            final_risk, valid_study_area, RISK_LEVEL_THRESHOLDS
         )
+        valid_pixels = np.int64(valid_pixels)
+        high_risk_pixels = np.int64(above_counts[2])
+        moderate_risk_pixels = np.int64(above_counts[1] - above_counts[2])
+        low_risk_pixels = np.int64(above_counts[0] - above_counts[1])
 
         total_area_km2 = (valid_pixels * pixel_area_m2) / 1_000_000.0
         high_risk_area_km2 = (high_risk_pixels * pixel_area_m2) / 1_000_000.0
         moderate_risk_area_km2 = (moderate_risk_pixels * pixel_area_m2) / 1_000_000.0
         low_risk_area_km2 = (low_risk_pixels * pixel_area_m2) / 1_000_000.0
 
-        valid_risk_values = final_risk[valid_study_area]
-        mean_risk = np.mean(valid_risk_values) if len(valid_risk_values) > 0 else 0.0
-        max_risk = np.max(valid_risk_values) if len(valid_risk_values) > 0 else 0.0
+        mean_risk = risk_sum / valid_pixels if valid_pixels > 0 else 0.0
+        max_risk = risk_max if valid_pixels > 0 else 0.0
 
         logger.info(f"  Total study area: {total_area_km2:.2f} km²")
         logger.info(
@@ -438,7 +633,60 @@ class HazardLayer:
         )
         logger.info(f"  Mean risk: {mean_risk:.3f}, Max risk: {max_risk:.3f}")
 
-        return final_risk.astype(np.float32)
+        return final_risk.astype(np.float32, copy=False)
+
+    def _get_scenario_invariant_layers(
+        self, dem_data: np.ndarray, transform: rasterio.Affine, land_mask: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get the rasters shared by all sea level scenarios on a DEM grid.
+
+        The study area mask and the river and coastline enhancement zones only
+        depend on the grid, the land mask and the vector inputs, so they are
+        computed on the first call and reused for every further scenario.
+
+        Args:
+            dem_data: Digital elevation model data array
+            transform: Affine transform matrix for spatial reference
+            land_mask: Boolean land mask (True=land, False=water)
+
+        Returns:
+            Dictionary with valid_study_area, river_risk_enhancement,
+            coastline_risk_enhancement and coastline_zone_mask arrays
+        """
+        cache_key = (tuple(transform), dem_data.shape)
+        layers = self._scenario_invariant_cache.get(cache_key)
+        if layers is not None:
+            return layers
+
+        # Land masks cached by earlier versions were stored as uint8
+        land_mask = land_mask.astype(bool, copy=False)
+
+        # Create mask for valid land areas (non-NaN DEM values)
+        valid_land_mask = ~np.isnan(dem_data)
+
+        # Always rasterize NUTS to DEM grid for study area definition
+        nuts_mask = self._get_nuts_mask(dem_data.shape, transform)
+
+        # Define valid study area combining land, NUTS, and data availability
+        valid_study_area = valid_land_mask & (nuts_mask == 1) & land_mask
+
+        coastline_risk_enhancement, coastline_zone_mask = (
+            self._calculate_coastline_risk_enhancement(
+                dem_data.shape, transform, land_mask
+            )
+        )
+
+        layers = {
+            "valid_study_area": valid_study_area,
+            "river_risk_enhancement": self._calculate_river_risk_enhancement(
+                dem_data.shape, transform
+            ),
+            "coastline_risk_enhancement": coastline_risk_enhancement,
+            "coastline_zone_mask": coastline_zone_mask,
+        }
+        self._scenario_invariant_cache[cache_key] = layers
+        return layers
 
     def _create_single_buffer_zone(
         self, river_polygons: gpd.GeoDataFrame, buffer_distance: float
@@ -1115,6 +1363,11 @@ class HazardLayer:
     ) -> Dict[str, np.ndarray]:
         """
         Process sea level rise scenarios with immediate TIF and PNG export per scenario.
+
+        The DEM, transform, CRS and coastline zone mask are shared by all
+        scenarios and stored by reference, so only the float32 flood risk
+        array is held per scenario.
+
         Args:
             custom_scenarios: Optional custom scenarios, uses defaults if None
         Returns:
@@ -1127,30 +1380,58 @@ class HazardLayer:
 
         dem_data, transform, crs, land_mask = self.load_and_prepare_dem()
 
-        _, coastline_zone_mask = self._calculate_coastline_risk_enhancement(
-            dem_data.shape, transform, land_mask
-        )
-
-        flood_extents = {}
-        for scenario in scenarios:
-            logger.info(
-                f"Processing scenario: {scenario.name} ({scenario.rise_meters}m)"
-            )
-            flood_risk = self.calculate_flood_extent(
-                dem_data, scenario.rise_meters, transform, land_mask
+        # Build the scenario-independent rasters once before the workers start
+        # so concurrent scenarios share them instead of each recomputing them
+        if self._load_nuts_boundaries() is None:
+            raise ValueError(
+                "Could not load NUTS boundaries - required for flood extent calculation"
             )
+        coastline_zone_mask = self._get_scenario_invariant_layers(
+            dem_data, transform, land_mask
+        )["coastline_zone_mask"]
+
+        # Scenarios only differ in sea level rise, so they are computed
+        # concurrently on the shared DEM. The heavy work (NumPy, SciPy filters,
+        # rasterio) releases the GIL, so threads avoid copying the rasters into
+        # worker processes. Exports stay on this thread as matplotlib is not
+        # thread-safe.
+        max_workers = max(1, min(len(scenarios), self.config.max_workers))
+        logger.info(f"Using {max_workers} parallel workers for scenario processing")
+
+        completed = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for scenario in scenarios:
+                logger.info(
+                    f"Processing scenario: {scenario.name} ({scenario.rise_meters}m)"
+                )
+                future = executor.submit(
+                    self.calculate_flood_extent,
+                    dem_data,
+                    scenario.rise_meters,
+                    transform,
+                    land_mask,
+                )
+                futures[future] = scenario
+
+            for future in as_completed(futures):
+                scenario = futures[future]
+                flood_data = {
+                    "flood_risk": future.result(),
+                    "scenario": scenario,
+                    "transform": transform,
+                    "crs": crs,
+                    "dem_data": dem_data,
+                    "coastline_zone_mask": coastline_zone_mask,
+                }
+                completed[scenario.name] = flood_data
 
-            flood_data = {
-                "flood_risk": flood_risk,
-                "scenario": scenario,
-                "transform": transform,
-                "crs": crs,
-                "dem_data": dem_data,
-                "coastline_zone_mask": coastline_zone_mask,
-            }
-            flood_extents[scenario.name] = flood_data
+                self._export_individual_scenario(scenario.name, flood_data, land_mask)
 
-            self._export_individual_scenario(scenario.name, flood_data, land_mask)
+        # Preserve the requested scenario order for downstream consumers
+        flood_extents = {
+            scenario.name: completed[scenario.name] for scenario in scenarios
+        }
 
         logger.info("Completed processing all scenarios with immediate export")
         return flood_extents
@@ -1182,6 +1463,28 @@ class HazardLayer:
         )
         risk_output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if self.config.quantize_hazard_exports:
+            export_profile = {
+                "dtype": np.uint8,
+                "nodata": HAZARD_EXPORT_NODATA,
+                "predictor": 2,
+            }
+        else:
+            export_profile = {"dtype": np.float32, "nodata": -9999.0, "predictor": 3}
+
+        def encode_rows(risk_rows: np.ndarray) -> np.ndarray:
+            if self.config.quantize_hazard_exports:
+                # Risk is bounded to [0, 1], so 254 levels plus a nodata value
+                # fit in uint8; readers restore floats via band scale/offset
+                return np.where(
+                    np.isnan(risk_rows),
+                    HAZARD_EXPORT_NODATA,
+                    np.round(np.clip(risk_rows, 0, 1) * HAZARD_EXPORT_LEVELS),
+                ).astype(np.uint8)
+            return np.ascontiguousarray(risk_rows, dtype=np.float32)
+
+        block_size = 512
+
         with rasterio.open(
             risk_output_path,
             "w",
@@ -1189,13 +1492,28 @@ class HazardLayer:
             height=flood_risk.shape[0],
             width=flood_risk.shape[1],
             count=1,
-            dtype=np.float32,
             crs=crs,
             transform=transform,
-            nodata=-9999.0,
+            # Tiled predictor layout compresses smoother risk surfaces
+            # better and speeds up windowed reads by downstream layers
+            tiled=True,
+            blockxsize=block_size,
+            blockysize=block_size,
             compress="lzw",
+            BIGTIFF="IF_SAFER",
+            num_threads="ALL_CPUS",
+            **export_profile,
         ) as dst:
-            dst.write(flood_risk, 1)
+            # Write one row of tiles at a time so only a strip is encoded
+            # and buffered for compression instead of a full raster copy
+            height, width = flood_risk.shape
+            for row_off in range(0, height, block_size):
+                rows = min(block_size, height - row_off)
+                dst.write(
+                    encode_rows(flood_risk[row_off : row_off + rows]),
+                    1,
+                    window=rasterio.windows.Window(0, row_off, width, rows),
+                )
             dst.set_band_description(
                 1, f"Normalized flood risk for {scenario.rise_meters}m SLR"
             )
@@ -1205,6 +1523,16 @@ class HazardLayer:
                 sea_level_rise_m=str(scenario.rise_meters),
                 method="elevation_profile_with_river_enhancement",
             )
+            if self.config.quantize_hazard_exports:
+                dst.scales = (1.0 / HAZARD_EXPORT_LEVELS,)
+                dst.offsets = (0.0,)
+                dst.update_tags(
+                    dtype_original="float32",
+                    risk_thresholds_scaled=",".join(
+                        str(round(threshold * HAZARD_EXPORT_LEVELS))
+                        for threshold in RISK_LEVEL_THRESHOLDS
+                    ),
+                )
 
         logger.info(f"  Exported TIF: {risk_output_path}")
 
@@ -1261,14 +1589,10 @@ class HazardLayer:
 
         # Get DEM bounds for consistent visualization extent
         first_scenario = list(flood_extents.values())[0]
-        dem_bounds = [
-            first_scenario["transform"].xoff,
-            first_scenario["transform"].xoff
-            + first_scenario["transform"].a * first_scenario["dem_data"].shape[1],
-            first_scenario["transform"].yoff
-            + first_scenario["transform"].e * first_scenario["dem_data"].shape[0],
-            first_scenario["transform"].yoff,
-        ]
+        west, south, east, north = rasterio.transform.array_bounds(
+            *first_scenario["dem_data"].shape, first_scenario["transform"]
+        )
+        dem_bounds = [west, east, south, north]
 
         logger.info(f"DEM bounds in visualization: {dem_bounds}")
 
@@ -1299,103 +1623,80 @@ class HazardLayer:
         reference_dem_data = reference_flood_data["dem_data"]
         reference_transform = reference_flood_data["transform"]
 
-        # Transform land mass data once outside the loop (optimization)
-        land_mass_data, land_transform, _ = self.transformer.transform_raster(
-            self.config.land_mass_path,
-            reference_bounds=None,
-            resampling_method=self.config.resampling_method.name.lower()
-            if hasattr(self.config.resampling_method, "name")
-            else str(self.config.resampling_method).lower(),
-        )
-        if not self.transformer.validate_alignment(
-            land_mass_data, land_transform, reference_dem_data, reference_transform
-        ):
-            land_mask_aligned = self.transformer.ensure_alignment(
-                land_mass_data,
-                land_transform,
-                reference_transform,
-                reference_dem_data.shape,
-                self.config.resampling_method.name.lower()
-                if hasattr(self.config.resampling_method, "name")
-                else str(self.config.resampling_method).lower(),
-            )
-        else:
-            land_mask_aligned = land_mass_data
-
-        land_mask = (land_mask_aligned > 0).astype(np.uint8)
+        # Aligned land mask is shared with the other visualization methods
+        land_mask = self._get_aligned_land_mask(reference_dem_data, reference_transform)
 
-        # Calculate dynamic elevation range for NUTS region
+        # Rasterize NUTS once - all scenarios share the reference DEM grid
         if nuts_gdf is not None:
-            nuts_mask = rasterio.features.rasterize(
-                [(geom, 1) for geom in nuts_gdf.geometry],
-                out_shape=reference_dem_data.shape,
-                transform=reference_transform,
-                dtype=np.uint8,
+            nuts_mask = self._get_nuts_mask(
+                reference_dem_data.shape, reference_transform
             )
-            # Get elevation data within NUTS and land areas only
-            nuts_land_mask = (
-                (nuts_mask == 1) & (land_mask == 1) & (~np.isnan(reference_dem_data))
-            )
-            if np.any(nuts_land_mask):
-                nuts_elevations = reference_dem_data[nuts_land_mask]
-                elevation_min = (
-                    np.percentile(nuts_elevations, 2) - 30
-                )  # Use 2nd percentile to avoid outliers and add 30m buffer to ensure that only water is blue
-                elevation_max = (
-                    np.percentile(nuts_elevations, 98) + 100
-                )  # Use 98th percentile to avoid outliers and add 100m buffer to ensure that the entire landscape is visible (not all white)
-                logger.info(
-                    f"Dynamic elevation range for NUTS region: {elevation_min:.1f}m to {elevation_max:.1f}m"
-                )
-            else:
-                # Fallback to global range if no valid data
-                valid_elevations = reference_dem_data[~np.isnan(reference_dem_data)]
-                elevation_min = (
-                    np.percentile(valid_elevations, 2) - 30
-                )  # Use 2nd percentile to avoid outliers and add 30m buffer to ensure that only water is blue
-                elevation_max = (
-                    np.percentile(valid_elevations, 98) + 100
-                )  # Use 98th percentile to avoid outliers and add 100m buffer to ensure that the entire landscape is visible (not all white)
-                logger.info(
-                    f"Fallback elevation range: {elevation_min:.1f}m to {elevation_max:.1f}m"
-                )
         else:
-            # Fallback to global range if no NUTS data
-            valid_elevations = reference_dem_data[~np.isnan(reference_dem_data)]
-            elevation_min = (
-                np.percentile(valid_elevations, 2) - 30
-            )  # Use 2nd percentile to avoid outliers and add 30m buffer to ensure that only water is blue
-            elevation_max = (
-                np.percentile(valid_elevations, 98) + 100
-            )  # Use 98th percentile to avoid outliers and add 100m buffer to ensure that the entire landscape is visible (not all white)
-            logger.info(
-                f"Global elevation range: {elevation_min:.1f}m to {elevation_max:.1f}m"
-            )
+            nuts_mask = np.ones(reference_dem_data.shape, dtype=np.uint8)
+
+        # Study area = NUTS & land & valid DEM, combined in place so a single
+        # boolean raster is allocated and shared by all panels below
+        valid_dem = ~np.isnan(reference_dem_data)
+        valid_study_area = nuts_mask == 1
+        np.logical_and(valid_study_area, land_mask, out=valid_study_area)
+        np.logical_and(valid_study_area, valid_dem, out=valid_study_area)
+
+        # Calculate dynamic elevation range for NUTS region, falling back to
+        # the global range if no NUTS data or no valid data
+        if nuts_gdf is not None and np.any(valid_study_area):
+            elevation_values = reference_dem_data[valid_study_area]
+            range_label = "NUTS Region"
+            range_description = "Dynamic elevation range for NUTS region"
+        else:
+            elevation_values = reference_dem_data[valid_dem]
+            range_label = "Study Area"
+            range_description = (
+                "Fallback elevation range"
+                if nuts_gdf is not None
+                else "Global elevation range"
+            )
+
+        # Use 2nd/98th percentiles to avoid outliers (one call, one partition).
+        # Add a 30m buffer below to ensure that only water is blue and 100m
+        # above so that the entire landscape is visible (not all white).
+        elevation_p2, elevation_p98 = np.percentile(elevation_values, [2, 98])
+        elevation_min = elevation_p2 - 30
+        elevation_max = elevation_p98 + 100
+        logger.info(
+            f"{range_description}: {elevation_min:.1f}m to {elevation_max:.1f}m"
+        )
+
+        # All map panels share the same grid cell size; rasters are reduced to
+        # the pixel size they are rendered at so imshow does not process
+        # pixels that cannot be displayed at the output DPI
+        panel_bbox = gs[0, 0].get_position(fig)
+        display_shape = (
+            int(panel_bbox.height * fig.get_figheight() * self.config.dpi),
+            int(panel_bbox.width * fig.get_figwidth() * self.config.dpi),
+        )
 
         # Panel 1: Overview/composite map with NUTS overlay and rivers
         ax = fig.add_subplot(gs[0, 0])
 
         # Use reference DEM for the overview
         dem_data = reference_dem_data
-        transform = reference_transform
 
         logger.info(
             f"DEM extent (target CRS): left={nuts_bounds[0]}, right={nuts_bounds[2]}, bottom={nuts_bounds[1]}, top={nuts_bounds[3]}"
         )
 
         # Create masked elevation data for proper visualization
-        # Create a copy of DEM data for visualization
-        dem_for_vis = dem_data.copy()
-
-        # Set water areas (where land_mask == 0) to a specific value for proper visualization
+        # Set water areas (outside land_mask) to a specific value in a single pass
         water_elevation = (
             elevation_min - 10
         )  # Set water to below minimum land elevation
-        dem_for_vis[land_mask == 0] = water_elevation
+        dem_for_vis = np.where(
+            ~land_mask, np.float32(water_elevation), dem_data
+        ).astype(np.float32, copy=False)
 
         # Create a base elevation visualization with proper water/land distinction
         im1 = ax.imshow(
-            dem_for_vis,
+            self._downsample_for_display(dem_for_vis, display_shape),
             cmap="terrain",
             aspect="equal",
             extent=dem_bounds,
@@ -1444,6 +1745,37 @@ class HazardLayer:
         cbar1 = plt.colorbar(im1, ax=ax, shrink=0.8)
         cbar1.set_label("Elevation (m)", rotation=270, labelpad=15)
 
+        # Scenario-independent background zones for panels 2-5
+        # Define zone values
+        WATER_VALUE = 0  # Existing water bodies (blue)
+        OUTSIDE_NL_VALUE = 1  # Land outside Netherlands (gray)
+        LAND_BASE_VALUE = 2  # Base value for Netherlands land
+
+        # Create composite visualization array with all base zones in one pass:
+        # Netherlands land areas, land outside Netherlands, everything else water
+        composite_display = np.select(
+            [valid_study_area, land_mask & (nuts_mask == 0)],
+            [np.uint8(LAND_BASE_VALUE), np.uint8(OUTSIDE_NL_VALUE)],
+            default=np.uint8(WATER_VALUE),
+        )
+
+        from matplotlib.cm import ScalarMappable
+        from matplotlib.colors import Normalize, to_rgba_array
+
+        # Base zone colors: Blue (water), Gray (outside NL), White (NL land base)
+        base_lut = to_rgba_array(["#1f78b4", "#bdbdbd", "#ffffff"]).astype(np.float32)
+        display_zones = self._downsample_for_display(
+            composite_display, display_shape, categorical=True
+        )
+        display_study_area = display_zones == LAND_BASE_VALUE
+        base_rgba = base_lut[display_zones]
+
+        # NUTS and river overlays are identical on every scenario panel, so
+        # render them once to an RGBA image instead of replotting the vectors
+        vector_overlay = self._render_vector_overlay(
+            nuts_gdf, dem_bounds, display_zones.shape, display_shape
+        )
+
         # Panels 2-5: Normalized flood risk for each scenario with rivers
         for i, scenario_name in enumerate(scenarios):
             if i >= 4:  # Only show first 4 scenarios
@@ -1457,112 +1789,35 @@ class HazardLayer:
             flood_data = flood_extents[scenario_name]
             flood_risk = flood_data["flood_risk"]  # Use normalized risk values
             scenario = flood_data["scenario"]
-            dem_data = flood_data["dem_data"]
-            transform = flood_data["transform"]
 
-            # Always rasterize NUTS to DEM grid
-            nuts_mask = rasterio.features.rasterize(
-                [(geom, 1) for geom in nuts_gdf.geometry],
-                out_shape=dem_data.shape,
-                transform=transform,
-                dtype=np.uint8,
-            )
-
-            # Create visualization showing normalized flood risk with proper background zones
-            valid_study_area = (
-                (land_mask == 1) & (nuts_mask == 1) & (~np.isnan(dem_data))
-            )
-
-            # Create composite visualization array
-            # Start with a base array for all zones
-            composite_display = np.zeros_like(dem_data, dtype=np.uint8)
-
-            # Define zone values
-            WATER_VALUE = 0  # Existing water bodies (blue)
-            OUTSIDE_NL_VALUE = 1  # Land outside Netherlands (gray)
-            LAND_BASE_VALUE = 2  # Base value for Netherlands land
-
-            # Set base zones
-            composite_display[land_mask == 0] = (
-                WATER_VALUE  # Water areas from land mass file
-            )
-            composite_display[(land_mask == 1) & (nuts_mask == 0)] = (
-                OUTSIDE_NL_VALUE  # Outside Netherlands
+            # Compose base zones and flood risk into a single RGBA image. Risk
+            # is only shown on Netherlands land areas and is pre-blended over
+            # the white land base at the overlay alpha, so one imshow call
+            # replaces the base layer plus alpha-blended risk layer.
+            risk_alpha = 0.85
+            risk_display = self._downsample_for_display(
+                np.where(valid_study_area, flood_risk, np.nan), display_shape
+            )
+            rgba = base_rgba.copy()
+            # Same binning as the colormap: floor(risk * N), with 1.0 in the last bin
+            risk_index = np.minimum(
+                (
+                    np.clip(risk_display[display_study_area], 0, 1)
+                    * len(FLOOD_RISK_LUT)
+                ).astype(np.intp),
+                len(FLOOD_RISK_LUT) - 1,
             )
-            composite_display[valid_study_area] = (
-                LAND_BASE_VALUE  # Netherlands land areas
+            risk_rgba = FLOOD_RISK_LUT[risk_index]
+            rgba[display_study_area] = (
+                risk_alpha * risk_rgba + (1 - risk_alpha) * base_lut[LAND_BASE_VALUE]
             )
 
-            # Create risk overlay only for valid study areas
-            risk_overlay = np.full_like(dem_data, np.nan, dtype=np.float32)
-            risk_overlay[valid_study_area] = flood_risk[valid_study_area]
-
-            # Display base zones first
-            from matplotlib.colors import ListedColormap, LinearSegmentedColormap
-
-            base_colors = [
-                "#1f78b4",
-                "#bdbdbd",
-                "#ffffff",
-            ]  # Blue (water), Gray (outside NL), White (NL land base)
-            base_cmap = ListedColormap(base_colors)
+            ax.imshow(rgba, aspect="equal", extent=dem_bounds)
+            im = ScalarMappable(norm=Normalize(vmin=0, vmax=1), cmap=FLOOD_RISK_CMAP)
 
-            # Show base zones
-            ax.imshow(
-                composite_display,
-                cmap=base_cmap,
-                aspect="equal",
-                extent=dem_bounds,
-                vmin=0,
-                vmax=2,
-                alpha=1.0,
-            )
-
-            # Create flood risk colormap (warm colors for risk)
-            risk_colors = [
-                "#ffffcc",
-                "#feb24c",
-                "#fd8d3c",
-                "#fc4e2a",
-                "#e31a1c",
-                "#b10026",
-            ]
-            risk_cmap = LinearSegmentedColormap.from_list(
-                "flood_risk", risk_colors, N=256
-            )
-
-            # Overlay flood risk only on Netherlands land areas
-            im = ax.imshow(
-                risk_overlay,
-                cmap=risk_cmap,
-                aspect="equal",
-                extent=dem_bounds,
-                vmin=0,
-                vmax=1,
-                alpha=0.85,
-            )
-
-            # NUTS overlay
-            if nuts_gdf is not None:
-                nuts_gdf.plot(
-                    ax=ax,
-                    facecolor="none",
-                    edgecolor="black",
-                    linewidth=0.5,
-                    alpha=1.0,
-                    zorder=10,
-                )
-
-            # River polygon network overlay - filled polygons with subtle outline
-            if self.river_polygon_network is not None:
-                self.river_polygon_network.plot(
-                    ax=ax,
-                    facecolor="darkblue",
-                    edgecolor="navy",
-                    linewidth=0.1,
-                    alpha=0.6,
-                    zorder=11,
-                )
+            # Pre-rendered NUTS and river polygon overlay
+            if vector_overlay is not None:
+                ax.imshow(vector_overlay, aspect="equal", extent=dem_bounds, zorder=10)
 
             ax.set_title(
                 f"{scenario.name} Scenario\n({scenario.rise_meters}m SLR) - Normalized Risk",
@@ -1576,7 +1831,7 @@ class HazardLayer:
             ax.autoscale(False)
 
             # Add colorbar for flood risk
-            cbar = plt.colorbar(im, ax=ax, shrink=0.8)
+            cbar = plt.colorbar(im, ax=ax, shrink=0.8, alpha=risk_alpha)
             cbar.set_label("Flood Risk (0=safe, 1=maximum)", rotation=270, labelpad=15)
 
             # Add legend for zones and risk levels
@@ -1609,14 +1864,12 @@ class HazardLayer:
             dem_data = flood_data["dem_data"]
 
             # Calculate area with significant flood risk (>0.3)
-            high_risk_area_km2 = np.sum(flood_risk > 0.3) * (30 * 30) / 1_000_000
+            high_risk_area_km2 = _count_above(flood_risk, 0.3) * self.PIXEL_AREA_KM2
             flood_areas.append(high_risk_area_km2)
             scenario_names.append(flood_data["scenario"].name)
             rise_values.append(flood_data["scenario"].rise_meters)
 
-        colors = ["#2e8b57", "#ff8c00", "#dc143c", "#8a2be2"][
-            : len(scenarios)
-        ]  # SeaGreen, DarkOrange, Crimson, BlueViolet
+        colors = list(self.SCENARIO_PALETTE[: len(scenarios)])
         bars = ax5.bar(scenario_names, flood_areas, color=colors, alpha=0.7)
         ax5.set_title(
             "High Flood Risk Area by Scenario\n(Risk > 0.3)",
@@ -1642,19 +1895,10 @@ class HazardLayer:
         ax6 = fig.add_subplot(gs[2, :])
         if self.river_polygon_network is not None:
             # Plot elevation histogram using dynamic range
-            if nuts_gdf is not None and np.any(nuts_land_mask):
-                valid_elevations = nuts_elevations
-                hist_range = (elevation_min, elevation_max)
-                range_label = "NUTS Region"
-            else:
-                valid_elevations = reference_dem_data[~np.isnan(reference_dem_data)]
-                hist_range = (elevation_min, elevation_max)
-                range_label = "Study Area"
-
             ax6.hist(
-                valid_elevations,
+                elevation_values,
                 bins=100,
-                range=hist_range,
+                range=(elevation_min, elevation_max),
                 alpha=0.7,
                 color="skyblue",
                 edgecolor="black",
@@ -1678,7 +1922,7 @@ class HazardLayer:
             stats_text = f"Elevation Statistics ({range_label}):\n"
             stats_text += f"Min: {elevation_min:.1f}m\n"
             stats_text += f"Max: {elevation_max:.1f}m\n"
-            stats_text += f"Mean: {np.mean(valid_elevations):.1f}m\n"
+            stats_text += f"Mean: {np.mean(elevation_values):.1f}m\n"
             if self.river_polygon_network is not None:
                 stats_text += "\nRiver Polygon Network:\n"
                 stats_text += f"Polygons: {len(self.river_polygon_network)}"
@@ -1726,6 +1970,194 @@ class HazardLayer:
         # TODO: Remove this before pushing
         # plt.show()
 
+    def _render_vector_overlay(
+        self,
+        nuts_gdf: Optional[gpd.GeoDataFrame],
+        extent: List[float],
+        raster_shape: Tuple[int, int],
+        display_shape: Tuple[int, int],
+    ) -> Optional[np.ndarray]:
+        """
+        Render NUTS boundaries and river polygons to a transparent RGBA image.
+
+        Args:
+            nuts_gdf: NUTS boundaries to outline, or None
+            extent: Map extent as [left, right, bottom, top]
+            raster_shape: Shape of the raster the overlay is drawn on
+            display_shape: Target (height, width) in output pixels
+
+        Returns:
+            RGBA image covering the extent, or None if there is nothing to draw
+        """
+        if nuts_gdf is None and self.river_polygon_network is None:
+            return None
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        # Keep the raster aspect ratio while fitting the display pixel size
+        scale = min(
+            display_shape[0] / raster_shape[0], display_shape[1] / raster_shape[1]
+        )
+        height = max(1, round(raster_shape[0] * scale))
+        width = max(1, round(raster_shape[1] * scale))
+
+        dpi = self.config.dpi
+        overlay_fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        overlay_fig.patch.set_alpha(0)
+        canvas = FigureCanvasAgg(overlay_fig)
+        overlay_ax = overlay_fig.add_axes([0, 0, 1, 1])
+        overlay_ax.set_axis_off()
+        overlay_ax.patch.set_alpha(0)
+
+        # NUTS overlay
+        if nuts_gdf is not None:
+            nuts_gdf.plot(
+                ax=overlay_ax,
+                facecolor="none",
+                edgecolor="black",
+                linewidth=0.5,
+                alpha=1.0,
+                zorder=10,
+            )
+
+        # River polygon network overlay - filled polygons with subtle outline
+        if self.river_polygon_network is not None:
+            self.river_polygon_network.plot(
+                ax=overlay_ax,
+                facecolor="darkblue",
+                edgecolor="navy",
+                linewidth=0.1,
+                alpha=0.6,
+                zorder=11,
+            )
+
+        overlay_ax.set_xlim(extent[0], extent[1])
+        overlay_ax.set_ylim(extent[2], extent[3])
+        overlay_ax.set_aspect("auto")
+
+        canvas.draw()
+        return np.asarray(canvas.buffer_rgba()).copy()
+
+    def _downsample_for_display(
+        self,
+        data: np.ndarray,
+        display_shape: Tuple[int, int],
+        categorical: bool = False,
+    ) -> np.ndarray:
+        """
+        Reduce a raster to roughly the pixel size it is rendered at.
+
+        Rasters larger than twice the display size are reduced by an integer
+        block factor. Continuous data uses a NaN-aware block mean, categorical
+        data uses nearest-neighbour sampling to preserve class codes.
+
+        Args:
+            data: 2D raster to display
+            display_shape: Target (height, width) in output pixels
+            categorical: Whether the raster holds class codes
+
+        Returns:
+            Downsampled raster, or the input if it is already small enough
+        """
+        factor = int(
+            min(
+                data.shape[0] // max(display_shape[0], 1),
+                data.shape[1] // max(display_shape[1], 1),
+            )
+        )
+        if factor < 2:
+            return data
+
+        if categorical:
+            return data[::factor, ::factor]
+
+        # Pad to a multiple of the block factor so edge blocks are kept
+        pad_rows = -data.shape[0] % factor
+        pad_cols = -data.shape[1] % factor
+        padded = np.pad(
+            data.astype(np.float32, copy=False),
+            ((0, pad_rows), (0, pad_cols)),
+            constant_values=np.nan,
+        )
+        blocks = padded.reshape(
+            padded.shape[0] // factor, factor, padded.shape[1] // factor, factor
+        )
+
+        valid = ~np.isnan(blocks)
+        sums = np.where(valid, blocks, 0).sum(axis=(1, 3))
+        counts = valid.sum(axis=(1, 3))
+        return np.divide(
+            sums,
+            counts,
+            out=np.full(sums.shape, np.nan, dtype=np.float32),
+            where=counts > 0,
+        )
+
+    def _get_nuts_mask(
+        self, shape: Tuple[int, int], transform: rasterio.Affine
+    ) -> np.ndarray:
+        """
+        Get the NUTS study area rasterized to a grid, rasterizing once per grid.
+
+        Args:
+            shape: Output raster shape (height, width)
+            transform: Affine transform of the output grid
+
+        Returns:
+            uint8 mask with 1 inside NUTS regions and 0 elsewhere
+        """
+        cache_key = (tuple(transform), tuple(shape))
+        nuts_mask = self._nuts_mask_cache.get(cache_key)
+        if nuts_mask is None:
+            nuts_mask = rasterio.features.rasterize(
+                self._nuts_shapes,
+                out_shape=shape,
+                transform=transform,
+                dtype=np.uint8,
+                all_touched=False,
+            )
+            self._nuts_mask_cache[cache_key] = nuts_mask
+        return nuts_mask
+
+    def _get_aligned_land_mask(
+        self, reference_dem_data: np.ndarray, reference_transform: rasterio.Affine
+    ) -> np.ndarray:
+        """
+        Get the land mask aligned to a reference DEM grid, computing it once per grid.
+
+        Args:
+            reference_dem_data: DEM array defining the target grid shape
+            reference_transform: Affine transform of the reference DEM
+
+        Returns:
+            Boolean land mask (True=land, False=water) on the reference grid
+        """
+        cache_key = (tuple(reference_transform), reference_dem_data.shape)
+        land_mask = self._land_mask_cache.get(cache_key)
+        if land_mask is not None:
+            return land_mask
+
+        land_mass_data, land_transform, _ = self.transformer.transform_raster(
+            self.config.land_mass_path,
+            reference_bounds=None,
+            resampling_method=self._resampling,
+        )
+        if not self.transformer.validate_alignment(
+            land_mass_data, land_transform, reference_dem_data, reference_transform
+        ):
+            land_mass_data = self.transformer.ensure_alignment(
+                land_mass_data,
+                land_transform,
+                reference_transform,
+                reference_dem_data.shape,
+                self._resampling,
+            )
+
+        land_mask = land_mass_data > 0
+        self._land_mask_cache[cache_key] = land_mask
+        return land_mask
+
     def _load_nuts_boundaries(self) -> gpd.GeoDataFrame:
         """
         Load NUTS administrative boundaries for overlay visualization.
@@ -1733,6 +2165,9 @@ class HazardLayer:
         Returns:
             GeoDataFrame with NUTS boundaries
         """
+        if self._nuts_gdf is not None:
+            return self._nuts_gdf
+
         try:
             # Get target CRS from config
             target_crs = rasterio.crs.CRS.from_string(self.config.target_crs)
@@ -1760,6 +2195,14 @@ class HazardLayer:
                         nuts_gdf = nuts_gdf.to_crs(target_crs)
                         logger.info(f"  Transformed to target CRS: {target_crs}")
 
+                    # Cache rasterization shapes so callers do not rebuild them.
+                    # All regions burn the same value, so they are dissolved
+                    # into one geometry for a single scan-conversion pass.
+                    from shapely.ops import unary_union
+
+                    self._nuts_shapes = [(unary_union(nuts_gdf.geometry.tolist()), 1)]
+                    self._nuts_gdf = nuts_gdf
+
                     return nuts_gdf
 
             logger.warning(
@@ -1825,31 +2268,10 @@ class HazardLayer:
         reference_dem_data = reference_flood_data["dem_data"]
         reference_transform = reference_flood_data["transform"]
 
-        # Transform land mass data once for all scenarios
-        land_mass_data, land_transform, _ = self.transformer.transform_raster(
-            self.config.land_mass_path,
-            reference_bounds=None,
-            resampling_method=self.config.resampling_method.name.lower()
-            if hasattr(self.config.resampling_method, "name")
-            else str(self.config.resampling_method).lower(),
-        )
-        if not self.transformer.validate_alignment(
-            land_mass_data, land_transform, reference_dem_data, reference_transform
-        ):
-            land_mask_aligned = self.transformer.ensure_alignment(
-                land_mass_data,
-                land_transform,
-                reference_transform,
-                reference_dem_data.shape,
-                self.config.resampling_method.name.lower()
-                if hasattr(self.config.resampling_method, "name")
-                else str(self.config.resampling_method).lower(),
-            )
-        else:
-            land_mask_aligned = land_mass_data
-
-        land_mask = (land_mask_aligned > 0).astype(np.uint8)
+        # Aligned land mask is shared with the other visualization methods
+        land_mask = self._get_aligned_land_mask(reference_dem_data, reference_transform)
 
+        render_jobs = []
         for scenario_name, flood_data in flood_extents.items():
             flood_risk = flood_data["flood_risk"]
             transform = flood_data["transform"]
@@ -1873,20 +2295,51 @@ class HazardLayer:
                 / f"hazard_risk_{scenario_name.lower()}_scenario.png"
             )
 
-            # Use unified visualizer for normalized risk visualization
-            self.visualizer.visualize_hazard_scenario(
-                flood_mask=flood_risk,  # Pass normalized risk values
-                dem_data=dem_data,
-                meta=meta,
-                show_nl_forecast=False,
-                scenario=scenario,
-                output_path=risk_png_path,
-                land_mask=land_mask,
-                show_coastline_overlay=False,
-                coastline_zone_mask=flood_extents[scenario_name]["coastline_zone_mask"],
-                river_polygon_network=self.river_polygon_network,
+            # Keyword arguments for the unified normalized risk visualization
+            render_jobs.append(
+                dict(
+                    flood_mask=flood_risk,  # Pass normalized risk values
+                    dem_data=dem_data,
+                    meta=meta,
+                    show_nl_forecast=False,
+                    scenario=scenario,
+                    output_path=risk_png_path,
+                    land_mask=land_mask,
+                    show_coastline_overlay=False,
+                    coastline_zone_mask=flood_data["coastline_zone_mask"],
+                    river_polygon_network=self.river_polygon_network,
+                )
             )
 
+        if not render_jobs:
+            return
+
+        # Scenario PNGs are independent and CPU-bound, so render them in
+        # parallel. The rasters are written once to .npy files that the
+        # workers memory-map, instead of pickling a copy per job, and the
+        # workers are spawned rather than forked from this threaded process
+        max_workers = max(1, min(len(render_jobs), self.config.max_workers))
+        with tempfile.TemporaryDirectory(
+            prefix=".render_", dir=self.config.output_dir
+        ) as spill_dir:
+            spilled = {}
+            render_jobs = [
+                spill_arrays(render_kwargs, spill_dir, spilled)
+                for render_kwargs in render_jobs
+            ]
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _render_hazard_scenario_png, self.config, render_kwargs
+                    )
+                    for render_kwargs in render_jobs
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
     def create_flood_risk_bar_charts(
         self, flood_extents: Dict[str, np.ndarray]
     ) -> None:
@@ -1898,83 +2351,51 @@ class HazardLayer:
         """
         logger.info("Creating standalone flood risk bar charts...")
 
+        pixel_area_km2 = self.PIXEL_AREA_KM2
+
+        # The study area is the same for every scenario, so it is computed
+        # once from the shared reference grid before the scenario loop
+        reference_flood_data = next(iter(flood_extents.values()))
+        dem_data = reference_flood_data["dem_data"]
+
+        # Load NUTS boundaries to calculate study area
+        nuts_gdf = self._load_nuts_boundaries()
+        if nuts_gdf is not None:
+            # Get reference data for land mask calculation
+            reference_transform = reference_flood_data["transform"]
+
+            land_mask = self._get_aligned_land_mask(dem_data, reference_transform)
+
+            # Rasterize NUTS to DEM grid
+            nuts_mask = self._get_nuts_mask(dem_data.shape, reference_transform)
+
+            # Count the valid study area in one blockwise pass over the rasters
+            total_study_area_km2 = (
+                _count_study_area(dem_data, nuts_mask, land_mask) * pixel_area_km2
+            )
+        else:
+            # Fallback: use all non-NaN DEM areas
+            total_study_area_km2 = (
+                dem_data.size - np.count_nonzero(np.isnan(dem_data))
+            ) * pixel_area_km2
+
         # Calculate data for both charts
         flood_areas = []
         scenario_names = []
         rise_values = []
-        total_study_area_km2 = None
 
-        for scenario_name in flood_extents.keys():
-            flood_data = flood_extents[scenario_name]
+        for flood_data in flood_extents.values():
             flood_risk = flood_data["flood_risk"]
-            dem_data = flood_data["dem_data"]
             scenario = flood_data["scenario"]
 
-            # Calculate pixel area in km²
-            pixel_area_km2 = (30 * 30) / 1_000_000
-
-            # Calculate total study area from first scenario (should be same for all)
-            if total_study_area_km2 is None:
-                # Load NUTS boundaries to calculate study area
-                nuts_gdf = self._load_nuts_boundaries()
-                if nuts_gdf is not None:
-                    # Get reference data for land mask calculation
-                    reference_transform = flood_data["transform"]
-
-                    # Transform land mass data
-                    land_mass_data, land_transform, _ = (
-                        self.transformer.transform_raster(
-                            self.config.land_mass_path,
-                            reference_bounds=None,
-                            resampling_method=self.config.resampling_method.name.lower()
-                            if hasattr(self.config.resampling_method, "name")
-                            else str(self.config.resampling_method).lower(),
-                        )
-                    )
-                    if not self.transformer.validate_alignment(
-                        land_mass_data, land_transform, dem_data, reference_transform
-                    ):
-                        land_mask_aligned = self.transformer.ensure_alignment(
-                            land_mass_data,
-                            land_transform,
-                            reference_transform,
-                            dem_data.shape,
-                            self.config.resampling_method.name.lower()
-                            if hasattr(self.config.resampling_method, "name")
-                            else str(self.config.resampling_method).lower(),
-                        )
-                    else:
-                        land_mask_aligned = land_mass_data
-
-                    land_mask = (land_mask_aligned > 0).astype(np.uint8)
-
-                    # Rasterize NUTS to DEM grid
-                    nuts_mask = rasterio.features.rasterize(
-                        [(geom, 1) for geom in nuts_gdf.geometry],
-                        out_shape=dem_data.shape,
-                        transform=reference_transform,
-                        dtype=np.uint8,
-                    )
-
-                    # Calculate valid study area
-                    valid_study_area = (
-                        (~np.isnan(dem_data)) & (nuts_mask == 1) & (land_mask == 1)
-                    )
-                    total_study_area_km2 = np.sum(valid_study_area) * pixel_area_km2
-                else:
-                    # Fallback: use all non-NaN DEM areas
-                    total_study_area_km2 = np.sum(~np.isnan(dem_data)) * pixel_area_km2
-
             # Calculate area with significant flood risk (>0.3)
-            high_risk_area_km2 = np.sum(flood_risk > 0.3) * pixel_area_km2
+            high_risk_area_km2 = _count_above(flood_risk, 0.3) * pixel_area_km2
             flood_areas.append(high_risk_area_km2)
             scenario_names.append(scenario.name)
             rise_values.append(scenario.rise_meters)
 
         # Define consistent colors for all charts
-        scenario_colors = ["#2e8b57", "#ff8c00", "#dc143c", "#8a2be2"][
-            : len(scenario_names)
-        ]  # SeaGreen, DarkOrange, Crimson, BlueViolet
+        scenario_colors = list(self.SCENARIO_PALETTE[: len(scenario_names)])
 
         # Create absolute bar chart
         self._create_absolute_flood_risk_chart(
@@ -1988,6 +2409,17 @@ class HazardLayer:
 
         logger.info("Completed creation of standalone flood risk bar charts")
 
+    def _chart_png_options(self) -> Dict:
+        """
+        Get Pillow PNG encoder options for the standalone charts.
+
+        Returns:
+            Fast, lightly compressed options if fast_png is enabled, else defaults
+        """
+        if self.config.fast_png:
+            return {"optimize": False, "compress_level": 1}
+        return {}
+
     def _create_absolute_flood_risk_chart(
         self, scenario_names: List[str], flood_areas: List[float], colors: List[str]
     ) -> None:
@@ -1999,9 +2431,15 @@ class HazardLayer:
             flood_areas: List of high risk areas in km²
             colors: List of colors for consistent styling
         """
-        plt.figure(figsize=(12, 8))
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
 
-        bars = plt.bar(
+        # Figure API without pyplot state, so no global figure is left open
+        fig = Figure(figsize=(12, 8))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+
+        bars = ax.bar(
             scenario_names,
             flood_areas,
             color=colors,
@@ -2010,19 +2448,19 @@ class HazardLayer:
             linewidth=1,
         )
 
-        plt.title(
+        ax.set_title(
             "High Flood Risk Area by Sea Level Rise Scenario\n(Risk > 0.3)",
             fontsize=16,
             fontweight="bold",
             pad=20,
         )
-        plt.ylabel("High Risk Area (km²)", fontsize=14, fontweight="bold")
-        plt.xlabel("Sea Level Rise Scenario", fontsize=14, fontweight="bold")
+        ax.set_ylabel("High Risk Area (km²)", fontsize=14, fontweight="bold")
+        ax.set_xlabel("Sea Level Rise Scenario", fontsize=14, fontweight="bold")
 
         # Add value labels on bars
         for bar, area in zip(bars, flood_areas):
             height = bar.get_height()
-            plt.text(
+            ax.text(
                 bar.get_x() + bar.get_width() / 2.0,
                 height + height * 0.01,
                 f"{area:.1f} km²",
@@ -2033,15 +2471,15 @@ class HazardLayer:
             )
 
         # Add grid for better readability
-        plt.grid(True, alpha=0.3, axis="y")
-        plt.gca().set_axisbelow(True)
+        ax.grid(True, alpha=0.3, axis="y")
+        ax.set_axisbelow(True)
 
         # Improve styling
-        plt.xticks(fontsize=12, fontweight="bold")
-        plt.yticks(fontsize=12)
+        plt.setp(ax.get_xticklabels(), fontsize=12, fontweight="bold")
+        ax.tick_params(axis="y", labelsize=12)
 
         # Add subtitle with methodology positioned in bottom right corner
-        plt.figtext(
+        fig.text(
             0.98,
             0.02,
             "Based on DEM analysis with river polygon enhancement and 30m resolution",
@@ -2051,16 +2489,19 @@ class HazardLayer:
             style="italic",
         )
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save the chart
         output_path = (
             self.config.output_dir / "hazard" / "flood_risk_absolute_by_scenario.png"
         )
-        plt.savefig(
-            output_path, dpi=self.config.dpi, bbox_inches="tight", facecolor="white"
+        fig.savefig(
+            output_path,
+            dpi=self.config.dpi,
+            bbox_inches="tight",
+            facecolor="white",
+            pil_kwargs=self._chart_png_options(),
         )
-        plt.close()
 
         logger.info(f"Saved absolute flood risk bar chart to: {output_path}")
 
@@ -2080,32 +2521,42 @@ class HazardLayer:
             total_area_km2: Total study area in km²
             colors: List of colors for consistent styling
         """
-        plt.figure(figsize=(12, 8))
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        # Figure API without pyplot state, so no global figure is left open
+        fig = Figure(figsize=(12, 8))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
 
         # Calculate percentages
-        risk_percentages = [(area / total_area_km2) * 100 for area in flood_areas]
-        safe_percentages = [100 - risk_pct for risk_pct in risk_percentages]
+        flood_area_values = np.fromiter(
+            flood_areas, dtype=np.float64, count=len(flood_areas)
+        )
+        risk_percentages = flood_area_values * (100.0 / total_area_km2)
+        safe_percentages = 100.0 - risk_percentages
 
         # Create stacked bar chart
         x_positions = range(len(scenario_names))
 
-        plt.title(
+        ax.set_title(
             "Relative Flood Risk Distribution by Sea Level Rise Scenario\n(Percentage of Total Study Area)",
             fontsize=16,
             fontweight="bold",
             pad=20,
         )
-        plt.ylabel("Percentage of Study Area (%)", fontsize=14, fontweight="bold")
-        plt.xlabel("Sea Level Rise Scenario", fontsize=14, fontweight="bold")
+        ax.set_ylabel("Percentage of Study Area (%)", fontsize=14, fontweight="bold")
+        ax.set_xlabel("Sea Level Rise Scenario", fontsize=14, fontweight="bold")
 
         # Set x-axis labels
-        plt.xticks(x_positions, scenario_names, fontsize=12, fontweight="bold")
-        plt.yticks(fontsize=12)
+        ax.set_xticks(x_positions)
+        ax.set_xticklabels(scenario_names, fontsize=12, fontweight="bold")
+        ax.tick_params(axis="y", labelsize=12)
 
         # Add percentage labels on risk areas
         for i, (risk_pct, area_km2) in enumerate(zip(risk_percentages, flood_areas)):
             if risk_pct > 2:  # Only show label if percentage is significant enough
-                plt.text(
+                ax.text(
                     i,
                     safe_percentages[i] + risk_pct / 2,
                     f"{risk_pct:.1f}%\n({area_km2:.1f} km²)",
@@ -2119,7 +2570,7 @@ class HazardLayer:
         # Add total area information on safe areas
         for i, safe_pct in enumerate(safe_percentages):
             if safe_pct > 10:  # Only show if there's enough space
-                plt.text(
+                ax.text(
                     i,
                     safe_pct / 2,
                     f"{safe_pct:.1f}%",
@@ -2131,19 +2582,19 @@ class HazardLayer:
                 )
 
         # Add grid for better readability
-        plt.grid(True, alpha=0.3, axis="y")
-        plt.gca().set_axisbelow(True)
+        ax.grid(True, alpha=0.3, axis="y")
+        ax.set_axisbelow(True)
 
         # Add legend
-        plt.legend(
+        ax.legend(
             loc="upper right", fontsize=12, frameon=True, fancybox=True, shadow=True
         )
 
         # Set y-axis to 0-100%
-        plt.ylim(0, 100)
+        ax.set_ylim(0, 100)
 
         # Add subtitle with total area information positioned in bottom right corner
-        plt.figtext(
+        fig.text(
             0.98,
             0.02,
             f"Total Study Area: {total_area_km2:.1f} km² (NUTS regions on land)",
@@ -2153,16 +2604,19 @@ class HazardLayer:
             style="italic",
         )
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save the chart
         output_path = (
             self.config.output_dir / "hazard" / "flood_risk_relative_by_scenario.png"
         )
-        plt.savefig(
-            output_path, dpi=self.config.dpi, bbox_inches="tight", facecolor="white"
+        fig.savefig(
+            output_path,
+            dpi=self.config.dpi,
+            bbox_inches="tight",
+            facecolor="white",
+            pil_kwargs=self._chart_png_options(),
         )
-        plt.close()
 
         logger.info(f"Saved relative flood risk stacked bar chart to: {output_path}")
 
@@ -2175,55 +2629,25 @@ class HazardLayer:
         """
         logger.info("Exporting comprehensive analysis results...")
 
-        # Export summary statistics
-        summary_stats = []
-        for scenario_name, flood_data in flood_extents.items():
-            flood_risk = flood_data["flood_risk"]
-            dem_data = flood_data["dem_data"]
-            scenario = flood_data["scenario"]
-
-            # Calculate areas for different risk levels
-            pixel_area_km2 = (30 * 30) / 1_000_000
-            total_valid_area_km2 = np.sum(~np.isnan(dem_data)) * pixel_area_km2
-
-            # Risk level statistics
-            high_risk_area_km2 = np.sum(flood_risk > 0.7) * pixel_area_km2
-            moderate_risk_area_km2 = (
-                np.sum((flood_risk > 0.3) & (flood_risk <= 0.7)) * pixel_area_km2
-            )
-            low_risk_area_km2 = (
-                np.sum((flood_risk > 0.1) & (flood_risk <= 0.3)) * pixel_area_km2
-            )
-
-            # Mean and maximum risk
-            valid_risk = flood_risk[~np.isnan(dem_data)]
-            mean_risk = np.mean(valid_risk) if len(valid_risk) > 0 else 0.0
-            max_risk = np.max(valid_risk) if len(valid_risk) > 0 else 0.0
-
-            summary_stats.append(
-                {
-                    "scenario": scenario_name,
-                    "sea_level_rise_m": scenario.rise_meters,
-                    "total_area_km2": total_valid_area_km2,
-                    "high_risk_area_km2": high_risk_area_km2,
-                    "moderate_risk_area_km2": moderate_risk_area_km2,
-                    "low_risk_area_km2": low_risk_area_km2,
-                    "high_risk_percentage": (high_risk_area_km2 / total_valid_area_km2)
-                    * 100,
-                    "moderate_risk_percentage": (
-                        moderate_risk_area_km2 / total_valid_area_km2
-                    )
-                    * 100,
-                    "low_risk_percentage": (low_risk_area_km2 / total_valid_area_km2)
-                    * 100,
-                    "mean_risk": mean_risk,
-                    "max_risk": max_risk,
-                    "description": scenario.description,
-                }
+        # The independent per-scenario statistics run on worker threads (the
+        # blockwise NumPy passes release the GIL)
+        max_workers = max(1, min(len(flood_extents), self.config.max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            summary_rows = list(
+                executor.map(
+                    lambda item: _summarize_flood_scenario(*item),
+                    flood_extents.items(),
+                )
             )
 
-        # Save summary as CSV
-        summary_df = pd.DataFrame(summary_stats)
+        # Save summary as CSV, building the DataFrame column by column
+        summary_df = pd.DataFrame(
+            {
+                column: list(values)
+                for column, values in zip(SUMMARY_COLUMNS, zip(*summary_rows))
+            },
+            columns=list(SUMMARY_COLUMNS),
+        )
         summary_path = (
             self.config.output_dir / "hazard" / "hazard_assessment_summary.csv"
         )
@@ -2241,7 +2665,7 @@ class HazardLayer:
         Args:
             shape: Shape of the raster grid
             transform: Affine transform matrix
-            land_mask: Binary land mask (1=land, 0=water)
+            land_mask: Boolean land mask (True=land, False=water)
 
         Returns:
             Tuple of (risk enhancement multiplier, coastline zone mask)
@@ -2395,10 +2819,10 @@ class HazardLayer:
             logger.info("Creating coastline influence zone...")
 
             # The buffer extends into both land and sea - we only want the land portion
-            coastline_zone_mask = (coastline_buffer_raster == 1) & (land_mask == 1)
+            coastline_zone_mask = (coastline_buffer_raster == 1) & land_mask
 
             # Calculate statistics
-            land_pixels = np.sum(land_mask == 1)
+            land_pixels = np.count_nonzero(land_mask)
             buffer_pixels_total = np.sum(coastline_buffer_raster == 1)
             affected_land_pixels = np.sum(coastline_zone_mask)
 
@@ -2420,7 +2844,7 @@ class HazardLayer:
             coastline_zone_mask = coastline_zone_mask.astype(np.uint8)
 
             affected_pixels = np.sum(coastline_zone_mask)
-            total_land_pixels = np.sum(land_mask == 1)
+            total_land_pixels = land_pixels
             affected_percentage = (
                 (affected_pixels / total_land_pixels * 100)
                 if total_land_pixels > 0
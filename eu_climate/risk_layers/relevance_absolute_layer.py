@@ -1,14 +1,23 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import logging
+import math
+import multiprocessing
+import tempfile
+import threading
 import rasterio
 import rasterio.features
+import rasterio.transform
 import rasterio.warp
 import geopandas as gpd
+import shapely
 import pandas as pd
 from typing import Tuple, Dict, List, Optional
 import numpy as np
 from pathlib import Path
+from shapely.geometry import box
 
 from eu_climate.config.config import ProjectConfig
-from eu_climate.utils.utils import setup_logging
+from eu_climate.utils.utils import load_spilled_arrays, setup_logging, spill_arrays
 from eu_climate.utils.conversion import RasterTransformer
 from eu_climate.utils.visualization import LayerVisualizer
 from eu_climate.risk_layers.exposition_layer import ExpositionLayer
@@ -19,6 +28,146 @@ from eu_climate.utils.freight_processor import SharedFreightProcessor
 
 logger = setup_logging(__name__)
 
+# Columns of the Eurostat CSV exports used by the absolute economic loaders
+EUROSTAT_COLUMNS = [
+    "geo",
+    "OBS_VALUE",
+    "unit",
+    "TIME_PERIOD",
+    "Geopolitical entity (reporting)",
+]
+EUROSTAT_DTYPES = {
+    "geo": str,
+    "unit": str,
+    "Geopolitical entity (reporting)": str,
+}
+
+# Cells per block of the region distribution; the label, exposition and
+# output blocks (16 bytes per cell) together stay around 1 MB, within L2
+DISTRIBUTION_BLOCK_SIZE = 1 << 16
+
+
+def _compensated_nansum(
+    values: np.ndarray,
+    where: Optional[np.ndarray] = None,
+    block_size: int = 1 << 20,
+) -> float:
+    """
+    Sum an array while skipping NaN, with compensated accumulation.
+
+    Each fixed-size block is reduced with NumPy's pairwise float64 summation
+    and the block partials are combined exactly with math.fsum, so rounding
+    error does not grow with the raster size and mass-conservation totals
+    reflect the true value defect rather than summation artifacts.
+
+    Args:
+        values: Array to sum
+        where: Optional boolean mask of the elements to include
+        block_size: Number of elements reduced per block
+
+    Returns:
+        Sum of all (selected) non-NaN values
+    """
+    flat = values.reshape(-1)
+    if where is None:
+        return math.fsum(
+            np.nansum(flat[start : start + block_size], dtype=np.float64)
+            for start in range(0, flat.size, block_size)
+        )
+    flat_where = where.reshape(-1)
+    return math.fsum(
+        np.nansum(
+            flat[start : start + block_size],
+            dtype=np.float64,
+            where=flat_where[start : start + block_size],
+        )
+        for start in range(0, flat.size, block_size)
+    )
+
+
+def _distribution_statistics(
+    values: np.ndarray, block_size: int = 1 << 20
+) -> Tuple[float, float, float]:
+    """
+    Compute the total, maximum and smallest positive value in one pass.
+
+    Every block is reduced three ways while it is still cache resident, so
+    the raster is streamed from memory once instead of once per statistic
+    and no full-size NaN or positive masks are allocated.
+
+    Args:
+        values: Array to summarize (NaN values are ignored)
+        block_size: Number of elements reduced per block
+
+    Returns:
+        Tuple of (compensated total, maximum, minimum positive value), with
+        0 for the maximum and minimum when there are no qualifying values
+    """
+    flat = values.reshape(-1)
+    block_totals = []
+    max_value = -np.inf
+    min_positive = np.inf
+    for start in range(0, flat.size, block_size):
+        block = flat[start : start + block_size]
+        block_totals.append(np.nansum(block, dtype=np.float64))
+        # fmax skips NaN without warning on all-NaN blocks
+        max_value = np.fmax(max_value, np.fmax.reduce(block))
+        min_positive = min(min_positive, np.min(block, where=block > 0, initial=np.inf))
+    return (
+        math.fsum(block_totals),
+        float(max_value) if np.isfinite(max_value) else 0.0,
+        float(min_positive) if np.isfinite(min_positive) else 0.0,
+    )
+
+
+def _nl_nuts_code_mask(geo: pd.Series, code_length: int) -> np.ndarray:
+    """
+    Select Netherlands NUTS codes of a given length with fixed-width comparisons.
+
+    The codes are converted once to a fixed-width unicode array and viewed as
+    a matrix of code points, so the 'NL' prefix and the code length are
+    checked with whole-column integer comparisons instead of per-row string
+    operations.
+
+    Args:
+        geo: Series of NUTS codes
+        code_length: Required number of characters (4 for L2, 5 for L3)
+
+    Returns:
+        Boolean array selecting NL codes of exactly code_length characters
+    """
+    codes = geo.to_numpy(dtype=str)
+    width = codes.dtype.itemsize // 4
+    if width < code_length:
+        return np.zeros(len(codes), dtype=bool)
+
+    code_points = codes.view(np.uint32).reshape(len(codes), width)
+    mask = (code_points[:, 0] == ord("N")) & (code_points[:, 1] == ord("L"))
+    # Fixed-width strings are padded with zeros, so the code is exactly
+    # code_length long when its last character is set and the next is padding
+    mask &= code_points[:, code_length - 1] != 0
+    if width > code_length:
+        mask &= code_points[:, code_length] == 0
+    return mask
+
+
+def _render_absolute_relevance_png(config: ProjectConfig, render_kwargs: Dict) -> None:
+    """
+    Render a single absolute relevance PNG in a worker process.
+
+    Args:
+        config: Project configuration used to build the visualizer
+        render_kwargs: Keyword arguments for LayerVisualizer.visualize_relevance_layer,
+            with arrays passed as spill_arrays references
+    """
+    import matplotlib
+
+    # Worker processes only write files, so force the non-interactive backend
+    matplotlib.use("Agg")
+    LayerVisualizer(config).visualize_relevance_layer(
+        **load_spilled_arrays(render_kwargs)
+    )
+
 
 class AbsoluteValueDistributor:
     """
@@ -64,6 +213,32 @@ class AbsoluteValueDistributor:
         """
         self.config = config
         self.transformer = transformer
+        # Region labels of the raster currently being distributed
+        self._region_labels = None
+        # Flat land pixel indices and the land mask they were built from
+        self._land_indices = None
+        self._land_indices_source = None
+        # (total, max, min positive) of the last distributed raster, computed
+        # by its INFO validation pass (None when INFO logging is disabled)
+        self.output_statistics = None
+
+    def _get_land_indices(self, land_mask: np.ndarray) -> np.ndarray:
+        """
+        Get the flat indices of land pixels, computed once per land mask.
+
+        All indicators of a run share the same land mask, so the indices are
+        memoized on the identity of the mask array.
+
+        Args:
+            land_mask: Binary mask defining land areas (1=land, 0=water)
+
+        Returns:
+            Flat indices of all land pixels
+        """
+        if self._land_indices_source is not land_mask:
+            self._land_indices = np.flatnonzero(land_mask.reshape(-1) == 1)
+            self._land_indices_source = land_mask
+        return self._land_indices
 
     def distribute_absolute_values(
         self,
@@ -72,6 +247,8 @@ class AbsoluteValueDistributor:
         land_mask: np.ndarray,
         enhanced_freight_datasets: dict = None,
         reference_meta: dict = None,
+        region_ids: Optional[np.ndarray] = None,
+        land_indices: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         Distribute absolute economic values across geographic space with mass conservation.
@@ -86,9 +263,13 @@ class AbsoluteValueDistributor:
             land_mask: Binary mask defining land areas (1=land, 0=water)
             enhanced_freight_datasets: Optional freight data for port enhancement
             reference_meta: Optional metadata for spatial reference
+            region_ids: Optional raster of region identifiers (0=no region) so
+                regions with identical economic values are kept apart
+            land_indices: Optional flat indices of the land pixels of
+                land_mask, so callers can share them across distributors
 
         Returns:
-            Distributed economic values maintaining mass conservation
+            Distributed float32 economic values maintaining mass conservation
         """
         logger.info("Distributing absolute economic values with mass conservation")
 
@@ -101,13 +282,19 @@ class AbsoluteValueDistributor:
         ):
             logger.warning("Raster alignment validation failed")
 
+        # Label the regions once; every later stage reuses these labels
+        self._region_labels = self._label_regions(economic_raster, region_ids)
+
         # Calculate original total value for mass conservation validation
-        original_total = self._calculate_original_total(economic_raster)
+        original_total = self._calculate_original_total(self._region_labels)
         logger.info(f"Original total value: {original_total:,.0f}")
 
         # Apply NUTS-based absolute distribution using exposition patterns
+        total_exposition = self._get_region_exposition_totals(
+            exposition_layer, self._region_labels
+        )
         distributed_absolute = self._apply_nuts_absolute_distribution(
-            economic_raster, exposition_layer
+            exposition_layer, self._region_labels, total_exposition
         )
 
         # Apply enhanced freight data if available
@@ -117,45 +304,126 @@ class AbsoluteValueDistributor:
                 distributed_absolute, enhanced_freight_datasets["port_freight"]
             )
 
-        # Check distributed total before mass conservation
-        distributed_total = np.sum(
-            distributed_absolute[~np.isnan(distributed_absolute)]
-        )
+        # Check distributed total before mass conservation. Conservation
+        # needs the same total, so it is reduced once and passed along
+        distributed_total = _compensated_nansum(distributed_absolute)
         logger.info(f"Distributed total before conservation: {distributed_total:,.0f}")
 
         # Apply mass conservation to ensure total value preservation
+        # The distributed raster is owned by this call, so it is conserved
+        # in place
         conserved_distribution = self._apply_mass_conservation(
-            distributed_absolute, original_total, land_mask
+            distributed_absolute,
+            original_total,
+            land_indices
+            if land_indices is not None
+            else self._get_land_indices(land_mask),
+            copy=False,
+            distributed_total=distributed_total,
         )
 
-        # Final validation of mass conservation
-        final_total = np.sum(conserved_distribution[~np.isnan(conserved_distribution)])
-        logger.info(f"Final conserved total: {final_total:,.0f}")
-        logger.info(
-            f"Mass conservation accuracy: {(final_total / original_total) * 100:.6f}%"
-        )
+        # Final validation of mass conservation. The validation pass also
+        # yields the max/min statistics, kept for the caller's final report
+        self.output_statistics = None
+        if logger.isEnabledFor(logging.INFO):
+            self.output_statistics = _distribution_statistics(conserved_distribution)
+            final_total = self.output_statistics[0]
+            logger.info(f"Final conserved total: {final_total:,.0f}")
+            logger.info(
+                f"Mass conservation accuracy: {(final_total / original_total) * 100:.6f}%"
+            )
 
         return conserved_distribution
 
-    def _calculate_original_total(self, economic_raster: np.ndarray) -> float:
+    def _label_regions(
+        self, economic_raster: np.ndarray, region_ids: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Label every raster cell with the index of its region.
+
+        With a region identifier raster the labels are the identifiers
+        themselves. Without one, cells are labelled by their unique economic
+        value, which merges regions that happen to share the same value.
+
+        Args:
+            economic_raster: Input raster with economic values by region
+            region_ids: Optional raster of region identifiers (0=no region)
+
+        Returns:
+            Tuple of (flat label array, economic value of each label,
+            cell count of each label)
+        """
+        if region_ids is None:
+            region_values, labels, region_cells = np.unique(
+                economic_raster, return_inverse=True, return_counts=True
+            )
+            return labels.reshape(-1), region_values, region_cells
+
+        labels = region_ids.reshape(-1)
+        region_values = np.zeros(int(labels.max(initial=0)) + 1, dtype=np.float64)
+        # Every cell of a region carries the same value, so scattering the
+        # raster into the lookup table recovers each region's value
+        region_values[labels] = economic_raster.reshape(-1)
+        region_cells = np.bincount(labels, minlength=region_values.size)
+        return labels, region_values, region_cells
+
+    def _calculate_original_total(
+        self, region_labels: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    ) -> float:
         """
         Calculate the total economic value from original NUTS raster data.
 
         This method determines the total economic value that must be preserved
-        throughout the distribution process to ensure mass conservation.
+        throughout the distribution process to ensure mass conservation. Each
+        region present in the raster contributes its value once.
 
         Args:
-            economic_raster: Input raster with economic values by region
+            region_labels: Region labels, values and cell counts from
+                _label_regions
 
         Returns:
             Total economic value from all regions
         """
-        unique_values = np.unique(economic_raster)
-        unique_values = unique_values[unique_values > 0]
-        return float(np.sum(unique_values))
+        _, region_values, region_cells = region_labels
+        present = (region_values > 0) & (region_cells > 0)
+        return math.fsum(region_values[present].tolist())
+
+    def _get_region_exposition_totals(
+        self,
+        exposition_layer: np.ndarray,
+        region_labels: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    ) -> np.ndarray:
+        """
+        Get the total exposition of every region.
+
+        Args:
+            exposition_layer: Exposition layer for spatial distribution patterns
+            region_labels: Region labels, values and cell counts from
+                _label_regions
+
+        Returns:
+            Total exposition per region label (float64)
+        """
+        # np.bincount converts its weights to float64, so the float32
+        # exposition is reduced in blocks to keep that conversion block-sized
+        # instead of a full-raster float64 copy
+        region_index, region_values, _ = region_labels
+        exposition_flat = exposition_layer.reshape(-1)
+        block_size = 1 << 20
+        totals = np.zeros(region_values.size, dtype=np.float64)
+        for start in range(0, region_index.size, block_size):
+            totals += np.bincount(
+                region_index[start : start + block_size],
+                weights=exposition_flat[start : start + block_size],
+                minlength=region_values.size,
+            )
+        return totals
 
     def _apply_nuts_absolute_distribution(
-        self, economic_raster: np.ndarray, exposition_layer: np.ndarray
+        self,
+        exposition_layer: np.ndarray,
+        region_labels: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        total_exposition: np.ndarray,
     ) -> np.ndarray:
         """
         Apply NUTS-based absolute distribution preserving original regional values.
@@ -165,38 +433,61 @@ class AbsoluteValueDistributor:
         region is preserved exactly.
 
         Args:
-            economic_raster: Input raster with economic values by region
             exposition_layer: Exposition layer for spatial distribution patterns
+            region_labels: Region labels, values and cell counts from
+                _label_regions
+            total_exposition: Total exposition per region label
 
         Returns:
             Spatially distributed economic values maintaining regional totals
         """
-        distributed = np.zeros_like(economic_raster, dtype=np.float32)
-
-        # Get unique economic values representing different regions
-        unique_values = np.unique(economic_raster)
-        unique_values = unique_values[unique_values > 0]
-
-        # Process each region individually
-        for region_value in unique_values:
-            # Create mask for current region
-            region_mask = economic_raster == region_value
-
-            # Get exposition values within this region
-            region_exposition = exposition_layer * region_mask
-            total_exposition = np.sum(region_exposition)
-
-            # Distribute regional value proportionally based on exposition
-            if total_exposition > 0:
-                # Proportional distribution based on exposition patterns
-                distributed += (region_exposition / total_exposition) * region_value
-            else:
-                # Fallback: uniform distribution within region if no exposition data
-                region_cells = np.sum(region_mask)
-                if region_cells > 0:
-                    distributed[region_mask] = region_value / region_cells
+        # Every cell is labelled with its region index, so per-region
+        # reductions become a single bincount over the raster
+        region_index, region_values, region_cells = region_labels
+        exposition_flat = exposition_layer.reshape(-1)
+
+        # Only positive economic values represent regions to distribute
+        is_region = region_values > 0
+        proportional = is_region & (total_exposition > 0)
+        # Fallback: uniform distribution within region if no exposition data
+        uniform = is_region & ~proportional & (region_cells > 0)
+
+        # Per-region lookup tables for the proportional scale and uniform
+        # value. Regional totals are reduced in float64, while the tables and
+        # all per-pixel arithmetic stay float32 like the stored rasters
+        scale_lut = np.zeros(region_values.size, dtype=np.float32)
+        scale_lut[proportional] = (
+            region_values[proportional] / total_exposition[proportional]
+        )
+        uniform_lut = np.zeros(region_values.size, dtype=np.float32)
+        uniform_lut[uniform] = region_values[uniform] / region_cells[uniform]
+
+        # Distribute regional values proportionally based on exposition. The
+        # gather, multiply and uniform fallback run on cache-sized blocks
+        # written straight into the float32 output, spread over worker
+        # threads (NumPy releases the GIL), so every block is read from memory
+        # once and no full-size temporaries are created
+        distributed = np.empty(region_index.size, dtype=np.float32)
+        block_size = DISTRIBUTION_BLOCK_SIZE
+        has_uniform = bool(uniform.any())
+
+        def distribute_block(start: int) -> None:
+            stop = start + block_size
+            block_index = region_index[start:stop]
+            out = distributed[start:stop]
+            np.take(scale_lut, block_index, out=out)
+            np.multiply(out, exposition_flat[start:stop], out=out)
+            if has_uniform:
+                block_uniform = uniform[block_index]
+                out[block_uniform] = uniform_lut[block_index[block_uniform]]
+
+        max_workers = max(1, self.config.max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(distribute_block, range(0, region_index.size, block_size))
+            )
 
-        return distributed
+        return distributed.reshape(exposition_layer.shape)
 
     def _apply_port_freight_enhancement(
         self, distributed_base: np.ndarray, port_freight_data: pd.DataFrame
@@ -209,7 +500,7 @@ class AbsoluteValueDistributor:
         handling activities.
 
         Args:
-            distributed_base: Base distributed economic values
+            distributed_base: Base distributed economic values, enhanced in place
             port_freight_data: DataFrame with port freight information
 
         Returns:
@@ -225,124 +516,163 @@ class AbsoluteValueDistributor:
         port_raster = self._rasterize_port_freight(
             port_freight_data, distributed_base.shape
         )
+        if port_raster is None:
+            return distributed_base
 
-        # Add port freight to base distribution
-        enhanced_distributed = distributed_base.copy()
-        port_mask = (port_raster > 0) & (~np.isnan(port_raster))
+        # Port pixels hold positive freight; NaN compares False, so a single
+        # predicate also excludes missing values
+        port_mask = port_raster > 0
+        port_pixels = np.count_nonzero(port_mask)
+        if port_pixels == 0:
+            return distributed_base
 
-        if np.any(port_mask):
-            enhanced_distributed[port_mask] += port_raster[port_mask]
-            logger.info(f"Added port freight to {np.sum(port_mask)} port pixels")
+        # Add port freight to base distribution in one masked in-place pass
+        np.add(
+            distributed_base,
+            port_raster,
+            out=distributed_base,
+            where=port_mask,
+        )
+        logger.info(f"Added port freight to {port_pixels} port pixels")
 
-        return enhanced_distributed
+        return distributed_base
 
     def _rasterize_port_freight(
         self, port_freight_data: pd.DataFrame, target_shape: Tuple[int, int]
-    ) -> np.ndarray:
+    ) -> Optional[np.ndarray]:
         """
-        Rasterize port freight data using high-resolution approach for accuracy.
+        Rasterize port freight data directly onto the target grid.
 
         This method converts port freight data from vector format to raster format,
-        using a high-resolution intermediate grid to ensure accurate spatial
-        representation of port activities.
+        burning each port's freight density scaled to the target pixel area and
+        summing overlapping ports.
 
         Args:
             port_freight_data: DataFrame containing port geometries and freight values
             target_shape: Shape of the target raster grid
 
         Returns:
-            Rasterized port freight data aligned with target grid
+            Rasterized port freight data aligned with target grid, or None when
+            no port freight falls on the grid
         """
         try:
             import rasterio.features
 
-            port_raster = np.zeros(target_shape, dtype=np.float32)
-
             # Get reference metadata for spatial transformation
             if hasattr(self, "_reference_meta") and self._reference_meta:
                 base_transform = self._reference_meta["transform"]
             else:
                 logger.warning("No reference metadata available for port rasterization")
-                return port_raster
-
-            # Use high-resolution intermediate grid for accuracy
-            target_resolution = self.config.target_resolution
-            port_resolution = max(
-                1.0, target_resolution / 2.0
-            )  # Higher resolution for ports
-
-            # Create high-resolution transform
-            hr_transform = rasterio.Affine(
-                port_resolution,
-                0.0,
-                base_transform.c,
-                0.0,
-                -port_resolution,
-                base_transform.f,
+                return None
+
+            # Freight per target pixel is the port's freight density times the
+            # pixel area of the target grid
+            pixel_area_square_meters = abs(base_transform.a * base_transform.e)
+
+            # Compute freight per pixel for all ports from column arrays
+            port_shapes = []
+            if {"geometry", "freight_value"}.issubset(port_freight_data.columns):
+                port_geometries = gpd.GeoSeries(port_freight_data["geometry"])
+                freight_values = port_freight_data["freight_value"].to_numpy(
+                    dtype=np.float64
+                )
+                # Missing geometries have NaN area and are excluded below
+                port_areas_square_meters = port_geometries.area.to_numpy()
+
+                valid_ports = (freight_values > 0) & (port_areas_square_meters > 0)
+                # Freight density per unit area scaled to the target pixel
+                freight_per_pixel = (
+                    freight_values[valid_ports] / port_areas_square_meters[valid_ports]
+                ) * pixel_area_square_meters
+                port_shapes = list(
+                    zip(
+                        port_geometries.to_numpy()[valid_ports],
+                        freight_per_pixel.tolist(),
+                    )
+                )
+
+            # Without valid ports there is nothing to burn, so neither the
+            # full-size raster nor its enhancement pass is needed
+            if not port_shapes:
+                logger.info("No ports with positive freight to rasterize")
+                return None
+
+            # Ports cover a small part of the grid, so only the pixel window
+            # around their combined bounds is rasterized
+            valid_port_geometries = gpd.GeoSeries(
+                [geometry for geometry, _ in port_shapes]
+            )
+            min_x, min_y, max_x, max_y = valid_port_geometries.total_bounds
+            col_min, row_min = ~base_transform * (min_x, max_y)
+            col_max, row_max = ~base_transform * (max_x, min_y)
+            row_start = max(0, int(np.floor(min(row_min, row_max))))
+            row_stop = min(target_shape[0], int(np.ceil(max(row_min, row_max))))
+            col_start = max(0, int(np.floor(min(col_min, col_max))))
+            col_stop = min(target_shape[1], int(np.ceil(max(col_min, col_max))))
+
+            if row_stop <= row_start or col_stop <= col_start:
+                logger.info("No ports overlap the target grid")
+                return None
+
+            window_shape = (row_stop - row_start, col_stop - col_start)
+            window_transform = base_transform * rasterio.Affine.translation(
+                col_start, row_start
             )
 
-            # Calculate high-resolution grid dimensions
-            hr_width = int(target_shape[1] * (target_resolution / port_resolution))
-            hr_height = int(target_shape[0] * (target_resolution / port_resolution))
-            hr_shape = (hr_height, hr_width)
-            hr_port_raster = np.zeros(hr_shape, dtype=np.float32)
-
-            # Process each port individually
-            for _, row in port_freight_data.iterrows():
-                if "geometry" in row and "freight_value" in row:
-                    freight_value = row.get("freight_value", 0)
-
-                    if freight_value > 0 and row["geometry"] is not None:
-                        # Calculate freight density per unit area
-                        port_area_square_meters = row["geometry"].area
-
-                        if port_area_square_meters > 0:
-                            freight_per_square_meter = (
-                                freight_value / port_area_square_meters
-                            )
-                            pixel_area_square_meters = port_resolution * port_resolution
-                            freight_per_pixel = (
-                                freight_per_square_meter * pixel_area_square_meters
-                            )
-
-                            # Rasterize this port
-                            single_port_raster = rasterio.features.rasterize(
-                                [(row["geometry"], freight_per_pixel)],
-                                out_shape=hr_shape,
-                                transform=hr_transform,
-                                fill=0,
-                                dtype=np.float32,
-                                merge_alg=rasterio.enums.MergeAlg.add,
-                            )
-
-                            # Add to high-resolution port raster
-                            hr_port_raster += single_port_raster
-
-            # Reproject high-resolution port raster to target resolution
-            from rasterio.warp import reproject, Resampling
-
-            reproject(
-                source=hr_port_raster,
-                destination=port_raster,
-                src_transform=hr_transform,
-                src_crs=self.config.target_crs,
-                dst_transform=base_transform,
-                dst_crs=self.config.target_crs,
-                resampling=Resampling.sum,  # Use sum to preserve total freight value
+            # Without overlapping ports every pixel belongs to at most one
+            # port, so port identifiers are burned once and mapped to freight
+            # through a lookup table
+            left, right = valid_port_geometries.sindex.query(
+                valid_port_geometries, predicate="intersects"
             )
+            if np.any(left != right):
+                # Overlapping ports: add their contributions
+                window_raster = rasterio.features.rasterize(
+                    port_shapes,
+                    out_shape=window_shape,
+                    transform=window_transform,
+                    fill=0,
+                    dtype=np.float32,
+                    merge_alg=rasterio.enums.MergeAlg.add,
+                )
+            else:
+                port_ids = rasterio.features.rasterize(
+                    [
+                        (geometry, port_id)
+                        for port_id, (geometry, _) in enumerate(port_shapes, start=1)
+                    ],
+                    out_shape=window_shape,
+                    transform=window_transform,
+                    fill=0,
+                    dtype=np.uint32,
+                )
+                freight_lut = np.array(
+                    [0.0] + [freight for _, freight in port_shapes],
+                    dtype=np.float32,
+                )
+                window_raster = freight_lut[port_ids]
 
-            logger.info(f"Rasterized ports: total freight = {port_raster.sum():,.0f}")
+            port_raster = np.zeros(target_shape, dtype=np.float32)
+            port_raster[row_start:row_stop, col_start:col_stop] = window_raster
+
+            # All freight lies in the window, so it is summed there
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Rasterized ports: total freight = {window_raster.sum():,.0f}"
+                )
             return port_raster
 
         except Exception as e:
             logger.error(f"Error rasterizing port freight data: {e}")
-            return np.zeros(target_shape, dtype=np.float32)
+            return None
 
     def _apply_mass_conservation(
         self,
         distributed_values: np.ndarray,
         original_total: float,
-        land_mask: np.ndarray,
+        land_indices: np.ndarray,
+        copy: bool = True,
+        distributed_total: Optional[float] = None,
     ) -> np.ndarray:
         """
         Apply mass conservation to ensure total value preservation.
@@ -354,13 +684,18 @@ class AbsoluteValueDistributor:
         Args:
             distributed_values: Spatially distributed economic values
             original_total: Original total economic value that must be preserved
-            land_mask: Binary mask defining valid land areas
+            land_indices: Flat indices of the valid land pixels
+            copy: Whether to redistribute into a copy instead of modifying
+                distributed_values in place
+            distributed_total: Total of distributed_values, if the caller has
+                already reduced it
 
         Returns:
             Mass-conserved economic distribution with exact total preservation
         """
-        # Calculate current total
-        distributed_total = np.sum(distributed_values[~np.isnan(distributed_values)])
+        # Calculate current total with compensated NaN-skipping summation
+        if distributed_total is None:
+            distributed_total = _compensated_nansum(distributed_values)
         value_difference = original_total - distributed_total
 
         logger.info(f"Value difference to redistribute: {value_difference:,.0f}")
@@ -372,36 +707,35 @@ class AbsoluteValueDistributor:
             )
             return distributed_values
 
-        # Get valid land areas with existing values for redistribution
-        valid_land_with_values = (
-            (land_mask == 1)
-            & (distributed_values > 0)
-            & (~np.isnan(distributed_values))
-        )
+        # Gather the land pixels once and keep those with existing values for
+        # redistribution (NaN compares False, so '> 0' excludes missing values)
+        land_values = distributed_values.reshape(-1)[land_indices]
+        has_value = land_values > 0
+        redistribution_indices = land_indices[has_value]
 
-        if not np.any(valid_land_with_values):
+        if redistribution_indices.size == 0:
             logger.warning("No valid land areas with values for redistribution")
             return distributed_values
 
-        # Calculate redistribution weights based on existing values
-        existing_values = distributed_values[valid_land_with_values]
-        total_existing = np.sum(existing_values)
+        # Total of the existing values that carry the redistribution, reduced
+        # under the mask instead of over a compacted copy
+        total_existing = _compensated_nansum(land_values, where=has_value)
 
+        conserved_distribution = (
+            distributed_values.copy() if copy else distributed_values
+        )
         if total_existing > 0:
-            # Proportional redistribution based on existing values
-            redistribution_weights = existing_values / total_existing
-            redistribution_per_pixel = value_difference * redistribution_weights
-
-            # Apply redistribution
-            conserved_distribution = distributed_values.copy()
-            conserved_distribution[valid_land_with_values] += redistribution_per_pixel
+            # Adding value_difference * (existing / total_existing) to every
+            # existing value equals scaling it by a single factor
+            scale = 1.0 + value_difference / total_existing
+            conserved_flat = conserved_distribution.reshape(-1)
+            conserved_flat[redistribution_indices] *= scale
 
             logger.info(
-                f"Redistributed {value_difference:,.0f} across {np.sum(valid_land_with_values)} pixels"
+                f"Redistributed {value_difference:,.0f} across {redistribution_indices.size} pixels"
             )
         else:
             logger.warning("No existing values for proportional redistribution")
-            conserved_distribution = distributed_values.copy()
 
         return conserved_distribution
 
@@ -450,7 +784,9 @@ class AbsoluteEconomicDataLoader:
         self.data_dir = config.data_dir
         self.freight_processor = SharedFreightProcessor(config)
 
-    def load_economic_datasets(self) -> Dict[str, pd.DataFrame]:
+    def load_economic_datasets(
+        self, indicators: Optional[List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
         """
         Load all economic datasets with enhanced debugging and error handling.
 
@@ -458,30 +794,40 @@ class AbsoluteEconomicDataLoader:
         absolute relevance analysis, providing comprehensive error handling and
         data validation throughout the process.
 
+        Args:
+            indicators: Optional list of datasets to load (e.g., ['gdp']). If
+                None, loads all datasets.
+
         Returns:
             Dictionary mapping dataset names to processed DataFrames
         """
         datasets = {}
 
+        def requested(dataset_name: str) -> bool:
+            return indicators is None or dataset_name in indicators
+
         # GDP dataset with fallback paths
-        gdp_loaded = self._load_gdp_data(datasets)
-        if not gdp_loaded:
-            logger.warning("GDP data could not be loaded - check file paths")
+        if requested("gdp"):
+            gdp_loaded = self._load_gdp_data(datasets)
+            if not gdp_loaded:
+                logger.warning("GDP data could not be loaded - check file paths")
 
         # Freight dataset using shared processor
-        freight_data, enhanced_datasets = self._load_freight_data_shared()
-        if not freight_data.empty:
-            datasets["freight"] = freight_data
-            # Store enhanced datasets for later use in distribution
-            if enhanced_datasets:
-                self.enhanced_freight_datasets = enhanced_datasets
-        else:
-            logger.warning("Freight data could not be loaded")
+        if requested("freight"):
+            freight_data, enhanced_datasets = self._load_freight_data_shared()
+            if not freight_data.empty:
+                datasets["freight"] = freight_data
+                # Store enhanced datasets for later use in distribution
+                if enhanced_datasets:
+                    self.enhanced_freight_datasets = enhanced_datasets
+            else:
+                logger.warning("Freight data could not be loaded")
 
         # HRST dataset with enhanced debugging
-        hrst_loaded = self._load_hrst_data(datasets)
-        if not hrst_loaded:
-            logger.warning("HRST data could not be loaded - check file paths")
+        if requested("hrst"):
+            hrst_loaded = self._load_hrst_data(datasets)
+            if not hrst_loaded:
+                logger.warning("HRST data could not be loaded - check file paths")
 
         # Log comprehensive dataset statistics
         logger.info(f"Successfully loaded datasets: {list(datasets.keys())}")
@@ -516,7 +862,10 @@ class AbsoluteEconomicDataLoader:
             gdp_path = self.data_dir / "L3-estat_gdp.csv" / "estat_nama_10r_3gdp_en.csv"
             if gdp_path.exists():
                 logger.info(f"Loading GDP dataset from {gdp_path}")
-                gdp_df = pd.read_csv(gdp_path)
+                # Parse only the columns used in processing
+                gdp_df = pd.read_csv(
+                    gdp_path, usecols=EUROSTAT_COLUMNS, dtype=EUROSTAT_DTYPES
+                )
                 datasets["gdp"] = self._process_gdp_data(gdp_df)
                 logger.info(
                     f"Successfully loaded GDP data with {len(datasets['gdp'])} regions"
@@ -552,7 +901,10 @@ class AbsoluteEconomicDataLoader:
             )
             if hrst_path.exists():
                 logger.info(f"Loading HRST dataset from {hrst_path}")
-                hrst_df = pd.read_csv(hrst_path)
+                # Parse only the columns used in processing
+                hrst_df = pd.read_csv(
+                    hrst_path, usecols=EUROSTAT_COLUMNS, dtype=EUROSTAT_DTYPES
+                )
                 datasets["hrst"] = self._process_hrst_data(hrst_df)
                 logger.info(
                     f"Successfully loaded HRST data with {len(datasets['hrst'])} regions"
@@ -613,13 +965,12 @@ class AbsoluteEconomicDataLoader:
         Returns:
             Processed DataFrame with standardized GDP values
         """
-        # Filter for Netherlands (NL) and NUTS L3 regions
-        nl_data = df[df["geo"].str.startswith("NL") & df["geo"].str.len().eq(5)]
-
-        # Filter for million EUR values
-        nl_data_mio = nl_data[nl_data["unit"].str.contains("MIO_EUR")].reset_index(
-            drop=True
-        )
+        # Filter for Netherlands (NL) NUTS L3 regions in million EUR with a
+        # single combined row mask
+        nl_data_mio = df[
+            _nl_nuts_code_mask(df["geo"], 5)
+            & df["unit"].str.contains("MIO_EUR", regex=False)
+        ]
 
         # Get latest available year
         latest_year = nl_data_mio["TIME_PERIOD"].max()
@@ -628,17 +979,23 @@ class AbsoluteEconomicDataLoader:
         # Clean and standardize column names
         processed = latest_data[
             ["geo", "OBS_VALUE", "unit", "Geopolitical entity (reporting)"]
-        ].copy()
-        processed.columns = ["nuts_code", "gdp_value", "unit", "region"]
+        ].rename(
+            columns={
+                "geo": "nuts_code",
+                "OBS_VALUE": "gdp_value",
+                "Geopolitical entity (reporting)": "region",
+            }
+        )
         processed["gdp_value"] = pd.to_numeric(processed["gdp_value"], errors="coerce")
 
         # Handle missing values with comprehensive logging
-        if processed.isna().any().any():
+        # A single row mask both detects and drops rows with missing values
+        complete_rows = processed.notna().all(axis=1).to_numpy()
+        dropped_rows = len(complete_rows) - np.count_nonzero(complete_rows)
+        if dropped_rows:
             logger.warning("NaN values detected in GDP data")
-            len_before = len(processed)
-            processed = processed.dropna()
-            len_after = len(processed)
-            logger.warning(f"Dropped {len_before - len_after} NaN values from GDP data")
+            processed = processed[complete_rows]
+            logger.warning(f"Dropped {dropped_rows} NaN values from GDP data")
 
         logger.info(
             f"Processed GDP data: {len(processed)} regions for year {latest_year}"
@@ -660,7 +1017,7 @@ class AbsoluteEconomicDataLoader:
             Processed DataFrame with standardized HRST values
         """
         # Filter for Netherlands and NUTS L2 (4 character codes starting with NL)
-        nl_data = df[df["geo"].str.startswith("NL") & df["geo"].str.len().eq(4)]
+        nl_data = df[_nl_nuts_code_mask(df["geo"], 4)]
 
         # Get latest available year
         latest_year = nl_data["TIME_PERIOD"].max()
@@ -669,21 +1026,25 @@ class AbsoluteEconomicDataLoader:
         # Clean and standardize column names
         processed = latest_data[
             ["geo", "OBS_VALUE", "unit", "Geopolitical entity (reporting)"]
-        ].copy()
-        processed.columns = ["nuts_code", "hrst_value", "unit", "region"]
+        ].rename(
+            columns={
+                "geo": "nuts_code",
+                "OBS_VALUE": "hrst_value",
+                "Geopolitical entity (reporting)": "region",
+            }
+        )
         processed["hrst_value"] = pd.to_numeric(
             processed["hrst_value"], errors="coerce"
         )
 
         # Handle missing values with comprehensive logging
-        if processed.isna().any().any():
+        # A single row mask both detects and drops rows with missing values
+        complete_rows = processed.notna().all(axis=1).to_numpy()
+        dropped_rows = len(complete_rows) - np.count_nonzero(complete_rows)
+        if dropped_rows:
             logger.warning("NaN values detected in HRST data")
-            len_before = len(processed)
-            processed = processed.dropna()
-            len_after = len(processed)
-            logger.warning(
-                f"Dropped {len_before - len_after} NaN values from HRST data"
-            )
+            processed = processed[complete_rows]
+            logger.warning(f"Dropped {dropped_rows} NaN values from HRST data")
 
         logger.info(
             f"Processed HRST data: {len(processed)} regions for year {latest_year}"
@@ -751,13 +1112,39 @@ class RelevanceAbsoluteLayer:
         self.transformer = RasterTransformer(
             target_crs=config.target_crs, config=config
         )
-        self.absolute_distributor = AbsoluteValueDistributor(config, self.transformer)
         self.exposition_layer = ExpositionLayer(config)
         self.visualizer = LayerVisualizer(config)
 
+        # Exposition metadata and land masks keyed by target grid, shared by
+        # the calculation and visualization stages
+        self._exposition_meta_cache = None
+        self._land_mask_cache = {}
+
+        # Output folders, resolved once and created when first written to
+        self._exposition_tif_dir = Path(config.output_dir) / "exposition" / "tif"
+        self._relevance_absolute_dir = Path(config.output_dir) / "relevance_absolute"
+        self._relevance_absolute_tif_dir = self._relevance_absolute_dir / "tif"
+
+        # Default exposition layer for indicators without configured weights,
+        # computed at most once. The lock also serializes the weighted
+        # exposition computations, which share the ExpositionLayer
+        self._default_exposition = None
+        self._exposition_lock = threading.Lock()
+
+        # Region identifier rasters shared by indicators on the same NUTS frame
+        self._region_ids_cache = {}
+        self._region_ids_locks = {}
+        self._region_ids_lock = threading.Lock()
+
+        # Per-run temporary directory of spilled relevance layers (only used
+        # with spill_relevance_layers)
+        self._spill_dir = None
+
         logger.info("Initialized Absolute Relevance Layer with enhanced data loading")
 
-    def load_and_process_absolute_economic_data(self) -> Dict[str, gpd.GeoDataFrame]:
+    def load_and_process_absolute_economic_data(
+        self, indicators: Optional[List[str]] = None
+    ) -> Dict[str, gpd.GeoDataFrame]:
         """
         Load and process all economic datasets for absolute value analysis.
 
@@ -765,11 +1152,16 @@ class RelevanceAbsoluteLayer:
         sources and joins them with appropriate NUTS administrative boundaries
         to create spatially-enabled economic data ready for distribution.
 
+        Args:
+            indicators: Optional list of datasets to load and join. If None,
+                processes all datasets.
+
         Returns:
             Dictionary mapping dataset names to GeoDataFrames with economic data
         """
-        # Load raw economic datasets
-        economic_datasets = self.economic_data_loader.load_economic_datasets()
+        # Load raw economic datasets (only the requested ones, so skipped
+        # indicators cost neither loading nor NUTS shapefile reads and joins)
+        economic_datasets = self.economic_data_loader.load_economic_datasets(indicators)
 
         if not economic_datasets:
             raise ValueError(
@@ -783,43 +1175,37 @@ class RelevanceAbsoluteLayer:
             "hrst": "l2",  # HRST is available at NUTS L2 level
         }
 
-        # Determine required NUTS levels
-        required_nuts_levels = set()
-        for dataset_name in economic_datasets.keys():
+        # Group the datasets by their NUTS level
+        level_datasets = {}
+        for dataset_name, dataset_data in economic_datasets.items():
             nuts_level = dataset_nuts_mapping.get(dataset_name, "l3")
-            required_nuts_levels.add(nuts_level)
+            level_datasets.setdefault(nuts_level, {})[dataset_name] = dataset_data
             logger.info(f"Dataset {dataset_name} mapped to NUTS level {nuts_level}")
 
-        # Load NUTS shapefiles for required levels
-        nuts_gdfs = {}
-        for nuts_level in required_nuts_levels:
-            nuts_gdfs[nuts_level] = self.nuts_mapper.load_nuts_shapefile(nuts_level)
-
-        # Join each dataset with its appropriate NUTS level
+        # Join all datasets of a level in one call. The joiner copies the
+        # NUTS frame itself, so each shapefile is loaded once and shared, and
+        # the NUTS code mapping is read once per level instead of per dataset
         joined_gdfs = {}
+        for nuts_level, datasets in level_datasets.items():
+            nuts_gdf = self.nuts_mapper.load_nuts_shapefile(nuts_level)
 
-        for dataset_name, dataset_data in economic_datasets.items():
-            nuts_level = dataset_nuts_mapping.get(dataset_name, "l3")
-            nuts_gdf = nuts_gdfs[nuts_level].copy()
-
-            logger.info(f"Joining {dataset_name} data with NUTS {nuts_level.upper()}")
-
-            # Use the standard economic data joining approach for all datasets
-            single_dataset = {dataset_name: dataset_data}
-            single_nuts = {nuts_level: nuts_gdf}
+            logger.info(
+                f"Joining {', '.join(datasets)} data with NUTS {nuts_level.upper()}"
+            )
             joined_result = self.nuts_mapper.join_economic_data(
-                single_nuts, single_dataset
+                {nuts_level: nuts_gdf}, datasets
             )
 
-            if dataset_name in joined_result:
-                joined_gdfs[dataset_name] = joined_result[dataset_name]
-                logger.info(
-                    f"Successfully joined {dataset_name} data: {len(joined_result[dataset_name])} regions"
-                )
-            else:
-                logger.warning(
-                    f"Failed to join {dataset_name} data with NUTS {nuts_level.upper()}"
-                )
+            for dataset_name in datasets:
+                if dataset_name in joined_result:
+                    joined_gdfs[dataset_name] = joined_result[dataset_name]
+                    logger.info(
+                        f"Successfully joined {dataset_name} data: {len(joined_result[dataset_name])} regions"
+                    )
+                else:
+                    logger.warning(
+                        f"Failed to join {dataset_name} data with NUTS {nuts_level.upper()}"
+                    )
 
         return joined_gdfs
 
@@ -844,10 +1230,6 @@ class RelevanceAbsoluteLayer:
         """
         logger.info("Calculating absolute economic relevance layers")
 
-        # Load and process economic data
-        nuts_economic_gdfs = self.load_and_process_absolute_economic_data()
-        exposition_meta = self._get_exposition_metadata()
-
         # Define target indicators for processing
         target_indicators = ["gdp", "freight", "hrst"]
 
@@ -860,6 +1242,12 @@ class RelevanceAbsoluteLayer:
             ]
             logger.info(f"Generating only requested indicators: {target_indicators}")
 
+        # Load and process economic data for the target indicators
+        nuts_economic_gdfs = self.load_and_process_absolute_economic_data(
+            target_indicators
+        )
+        exposition_meta = self._get_exposition_metadata()
+
         # Filter to available indicators
         available_indicators = [
             indicator
@@ -872,85 +1260,245 @@ class RelevanceAbsoluteLayer:
         land_mask = self._load_land_mask(exposition_meta)
         absolute_relevance_layers = {}
 
-        # Process each indicator individually
-        for indicator_name in available_indicators:
-            nuts_gdf = nuts_economic_gdfs[indicator_name]
+        # Read the enhanced freight datasets once, before any worker starts
+        enhanced_freight_datasets = getattr(
+            self.economic_data_loader, "enhanced_freight_datasets", None
+        )
+
+        # Flat land pixel indices, computed once and shared by every
+        # indicator's distributor
+        land_indices = np.flatnonzero(land_mask.reshape(-1) == 1)
+
+        # Spilled layers of this run go to their own temporary directory,
+        # created before the workers start
+        if self.config.spill_relevance_layers:
+            self._release_spilled_layers()
+            self._spill_dir = tempfile.TemporaryDirectory(
+                prefix="eu_climate_relevance_", ignore_cleanup_errors=True
+            )
+
+        # Process the indicators concurrently. Rasterization, raster I/O and
+        # the large NumPy operations release the GIL, so the indicators
+        # overlap; peak memory grows with the number of workers
+        max_workers = max(1, min(len(available_indicators), self.config.max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                indicator_name: executor.submit(
+                    self._process_indicator,
+                    indicator_name,
+                    nuts_economic_gdfs[indicator_name],
+                    exposition_meta,
+                    land_mask,
+                    land_indices,
+                    enhanced_freight_datasets,
+                )
+                for indicator_name in available_indicators
+            }
+            for indicator_name in available_indicators:
+                absolute_relevance_layers[indicator_name] = futures[
+                    indicator_name
+                ].result()
+
+        # The region identifier rasters are only needed while distributing,
+        # so they are not kept alive through saving and visualization
+        self._region_ids_cache.clear()
+        self._region_ids_locks.clear()
+
+        # Validate results
+        if not absolute_relevance_layers:
+            raise ValueError("No absolute relevance layers could be calculated")
+
+        logger.info(
+            f"Completed absolute relevance calculation for {len(absolute_relevance_layers)} indicators"
+        )
+
+        return absolute_relevance_layers, exposition_meta
+
+    def _process_indicator(
+        self,
+        indicator_name: str,
+        nuts_gdf: gpd.GeoDataFrame,
+        exposition_meta: dict,
+        land_mask: np.ndarray,
+        land_indices: np.ndarray,
+        enhanced_freight_datasets: Optional[dict] = None,
+    ) -> np.ndarray:
+        """
+        Rasterize and distribute a single indicator.
+
+        Args:
+            indicator_name: Name of the economic indicator
+            nuts_gdf: NUTS regions joined with the indicator values
+            exposition_meta: Spatial metadata of the exposition layer
+            land_mask: Binary mask defining land areas (1=land, 0=water)
+            land_indices: Flat indices of the land pixels of land_mask
+            enhanced_freight_datasets: Enhanced freight datasets of the
+                economic data loader, if loaded
+
+        Returns:
+            Absolute distributed raster of the indicator
+        """
+        economic_raster, raster_meta, region_ids, economic_exposition_data = (
+            self._prepare_indicator_inputs(indicator_name, nuts_gdf, exposition_meta)
+        )
+        absolute_distributed_raster = self._distribute_indicator(
+            indicator_name,
+            economic_raster,
+            raster_meta,
+            region_ids,
+            economic_exposition_data,
+            land_mask,
+            land_indices,
+            enhanced_freight_datasets,
+        )
+        if self.config.spill_relevance_layers:
+            return self._spill_relevance_layer(
+                indicator_name, absolute_distributed_raster
+            )
+        return absolute_distributed_raster
+
+    def _spill_relevance_layer(
+        self, indicator_name: str, data: np.ndarray
+    ) -> np.ndarray:
+        """
+        Move a finished relevance layer to a disk-backed memory map.
 
-            logger.info(f"Processing {indicator_name} for absolute relevance")
+        The layer is written once as an uncompressed .npy file in the run's
+        temporary spill directory and reopened copy-on-write, so the finished
+        layers of all indicators no longer have to stay resident while the
+        remaining indicators are processed, saved and visualized, and
+        consumers can still modify their view.
 
-            # Rasterize NUTS regions with economic values
-            economic_raster, raster_meta = self._rasterize_nuts_regions_absolute(
+        Args:
+            indicator_name: Name of the economic indicator
+            data: Distributed relevance raster
+
+        Returns:
+            Memory-mapped relevance raster with the same values
+        """
+        spill_path = (
+            Path(self._spill_dir.name) / f"absolute_relevance_{indicator_name}.npy"
+        )
+        np.save(spill_path, data)
+        logger.info(
+            f"Spilled absolute {indicator_name} relevance layer to {spill_path}"
+        )
+        return np.load(spill_path, mmap_mode="c")
+
+    def _release_spilled_layers(self):
+        """Remove the temporary directory of spilled relevance layers, if any."""
+        if self._spill_dir is not None:
+            self._spill_dir.cleanup()
+            self._spill_dir = None
+
+    def _prepare_indicator_inputs(
+        self,
+        indicator_name: str,
+        nuts_gdf: gpd.GeoDataFrame,
+        exposition_meta: dict,
+    ) -> Tuple[np.ndarray, dict, np.ndarray, np.ndarray]:
+        """
+        Rasterize an indicator's regions and load its aligned exposition layer.
+
+        Args:
+            indicator_name: Name of the economic indicator
+            nuts_gdf: NUTS regions joined with the indicator values
+            exposition_meta: Spatial metadata of the exposition layer
+
+        Returns:
+            Tuple of (economic raster, raster metadata, region identifier
+            raster, exposition layer aligned to the economic raster)
+        """
+        logger.info(f"Processing {indicator_name} for absolute relevance")
+
+        # Rasterize NUTS regions with economic values
+        economic_raster, raster_meta, region_ids = (
+            self._rasterize_nuts_regions_absolute(
                 nuts_gdf, exposition_meta, indicator_name
             )
+        )
 
-            # Get exposition layer for spatial distribution
-            economic_exposition_data = self._get_economic_exposition_layer(
-                indicator_name
+        # Get exposition layer for spatial distribution
+        economic_exposition_data = self._get_economic_exposition_layer(indicator_name)
+
+        # Ensure spatial alignment
+        if economic_exposition_data.shape != economic_raster.shape:
+            logger.warning(f"Shape mismatch for {indicator_name}, ensuring alignment")
+            economic_exposition_data = self.transformer.ensure_alignment(
+                economic_exposition_data,
+                exposition_meta["transform"],
+                raster_meta["transform"],
+                economic_raster.shape,
+                self.config.resampling_method,
             )
 
-            # Ensure spatial alignment
-            if economic_exposition_data.shape != economic_raster.shape:
-                logger.warning(
-                    f"Shape mismatch for {indicator_name}, ensuring alignment"
-                )
-                economic_exposition_data = self.transformer.ensure_alignment(
-                    economic_exposition_data,
-                    exposition_meta["transform"],
-                    raster_meta["transform"],
-                    economic_raster.shape,
-                    self.config.resampling_method,
-                )
+        return economic_raster, raster_meta, region_ids, economic_exposition_data
 
-            # Apply enhanced freight data if available
-            enhanced_datasets = None
-            if indicator_name == "freight":
-                if hasattr(self.economic_data_loader, "enhanced_freight_datasets"):
-                    enhanced_datasets = (
-                        self.economic_data_loader.enhanced_freight_datasets
-                    )
-                    logger.info(
-                        "Using enhanced freight datasets for absolute distribution"
-                    )
-                else:
-                    logger.warning(
-                        "Enhanced freight datasets not available in economic data loader"
-                    )
+    def _distribute_indicator(
+        self,
+        indicator_name: str,
+        economic_raster: np.ndarray,
+        raster_meta: dict,
+        region_ids: np.ndarray,
+        economic_exposition_data: np.ndarray,
+        land_mask: np.ndarray,
+        land_indices: Optional[np.ndarray] = None,
+        enhanced_freight_datasets: Optional[dict] = None,
+    ) -> np.ndarray:
+        """
+        Distribute one indicator's regional values with mass conservation.
 
-            # Apply absolute distribution with mass conservation
-            absolute_distributed_raster = (
-                self.absolute_distributor.distribute_absolute_values(
-                    economic_raster,
-                    economic_exposition_data,
-                    land_mask,
-                    enhanced_datasets,
-                    raster_meta,
+        Args:
+            indicator_name: Name of the economic indicator
+            economic_raster: Rasterized regional values of the indicator
+            raster_meta: Spatial metadata of the economic raster
+            region_ids: Raster of region identifiers (0=no region)
+            economic_exposition_data: Exposition layer aligned to the raster
+            land_mask: Binary mask defining land areas (1=land, 0=water)
+            land_indices: Optional flat indices of the land pixels of land_mask
+            enhanced_freight_datasets: Enhanced freight datasets of the
+                economic data loader, if loaded
+
+        Returns:
+            Absolute distributed raster of the indicator
+        """
+        # Apply enhanced freight data if available
+        enhanced_datasets = None
+        if indicator_name == "freight":
+            if enhanced_freight_datasets is not None:
+                enhanced_datasets = enhanced_freight_datasets
+                logger.info("Using enhanced freight datasets for absolute distribution")
+            else:
+                logger.warning(
+                    "Enhanced freight datasets not available in economic data loader"
                 )
-            )
 
-            # Store result
-            absolute_relevance_layers[indicator_name] = absolute_distributed_raster
+        # Apply absolute distribution with mass conservation. Distributors
+        # keep per-call state (region labels, output statistics), so each
+        # indicator gets its own, released on return
+        distributor = AbsoluteValueDistributor(self.config, self.transformer)
+        absolute_distributed_raster = distributor.distribute_absolute_values(
+            economic_raster,
+            economic_exposition_data,
+            land_mask,
+            enhanced_datasets,
+            raster_meta,
+            region_ids,
+            land_indices,
+        )
 
-            # Log final statistics for validation
-            final_total = np.sum(
-                absolute_distributed_raster[~np.isnan(absolute_distributed_raster)]
-            )
-            max_value = np.nanmax(absolute_distributed_raster)
-            min_value = np.nanmin(
-                absolute_distributed_raster[absolute_distributed_raster > 0]
+        # Log final statistics for validation, reusing the distributor's
+        # validation pass (a full-raster reduction only run at INFO level)
+        if logger.isEnabledFor(logging.INFO):
+            final_total, max_value, min_value = (
+                distributor.output_statistics
+                or _distribution_statistics(absolute_distributed_raster)
             )
             logger.info(
                 f"Final {indicator_name} distribution - Total: {final_total:,.0f}, Max: {max_value:,.6f}, Min: {min_value:,.6f}"
             )
 
-        # Validate results
-        if not absolute_relevance_layers:
-            raise ValueError("No absolute relevance layers could be calculated")
-
-        logger.info(
-            f"Completed absolute relevance calculation for {len(absolute_relevance_layers)} indicators"
-        )
-
-        return absolute_relevance_layers, exposition_meta
+        return absolute_distributed_raster
 
     def _get_exposition_metadata(self) -> dict:
         """
@@ -963,9 +1511,13 @@ class RelevanceAbsoluteLayer:
         Returns:
             Dictionary containing spatial metadata (transform, CRS, dimensions)
         """
-        default_path = (
-            Path(self.config.output_dir) / "exposition" / "tif" / "exposition_layer.tif"
-        )
+        if self._exposition_meta_cache is None:
+            self._exposition_meta_cache = self._read_exposition_metadata()
+        return self._exposition_meta_cache
+
+    def _read_exposition_metadata(self) -> dict:
+        """Read exposition metadata from disk, generating the layer if missing."""
+        default_path = self._exposition_tif_dir / "exposition_layer.tif"
 
         if default_path.exists():
             with rasterio.open(default_path) as src:
@@ -989,89 +1541,259 @@ class RelevanceAbsoluteLayer:
 
     def _rasterize_nuts_regions_absolute(
         self, nuts_gdf: gpd.GeoDataFrame, exposition_meta: dict, economic_variable: str
-    ) -> Tuple[np.ndarray, dict]:
-        """Rasterize NUTS regions preserving absolute economic values."""
-        logger.info(f"Rasterizing NUTS regions for absolute {economic_variable}")
+    ) -> Tuple[np.ndarray, dict, np.ndarray]:
+        """
+        Rasterize NUTS regions preserving absolute economic values and region identity.
 
-        transform = exposition_meta["transform"]
-        height = exposition_meta["height"]
-        width = exposition_meta["width"]
+        Every region of the frame is burned as an identifier (see
+        _rasterize_nuts_ids), whether or not it has a value for this
+        indicator; the values are then mapped onto the identifiers through a
+        per-indicator lookup table in which regions without a positive value
+        are zero.
+        """
+        logger.info(f"Rasterizing NUTS regions for absolute {economic_variable}")
 
         value_column = f"{economic_variable}_value"
         if value_column not in nuts_gdf.columns:
             raise ValueError(f"Economic variable {value_column} not found in data")
 
-        shapes = [
-            (geom, value)
-            for geom, value in zip(nuts_gdf.geometry, nuts_gdf[value_column])
-            if not np.isnan(value) and value > 0
-        ]
-
-        raster = rasterio.features.rasterize(
-            shapes,
-            out_shape=(height, width),
-            transform=transform,
-            fill=0,
-            dtype=np.float32,
-        )
+        # Region identifiers number every row of the frame (1..n, 0=no
+        # region); regions without a positive value (NaN compares False) map
+        # to zero in the per-indicator lookup table
+        values = nuts_gdf[value_column].to_numpy(dtype=np.float64)
+        region_ids = self._get_nuts_region_ids(nuts_gdf, exposition_meta)
+        has_value = values > 0
+        region_value_lut = np.zeros(len(values) + 1, dtype=np.float32)
+        region_value_lut[1:][has_value] = values[has_value]
+        raster = region_value_lut[region_ids]
 
         meta = exposition_meta.copy()
         meta["dtype"] = "float32"
 
-        logger.info(
-            f"Rasterized absolute {economic_variable}: "
-            f"shape={raster.shape}, min={np.min(raster)}, max={np.max(raster)}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Rasterized absolute {economic_variable}: "
+                f"shape={raster.shape}, min={np.min(raster)}, max={np.max(raster)}"
+            )
 
-        return raster, meta
+        return raster, meta, region_ids
 
-    def _get_economic_exposition_layer(self, dataset_name: str) -> np.ndarray:
-        """Get economic exposition layer for spatial distribution."""
-        tif_path = (
-            Path(self.config.output_dir)
-            / "exposition"
-            / "tif"
-            / f"exposition_{dataset_name}.tif"
+    def _get_nuts_region_ids(
+        self, nuts_gdf: gpd.GeoDataFrame, exposition_meta: dict
+    ) -> np.ndarray:
+        """Get the region identifier raster of a NUTS frame, burned once per grid.
+
+        Indicators joined onto the same NUTS level share their geometries, so
+        the identifier raster is keyed by the frame's NUTS codes and the grid
+        and reused across indicators. The returned array is shared and must
+        not be modified.
+        """
+        code_col = next(
+            (
+                col
+                for col in ["NUTS_ID", "nuts_id", "geo", "GEOCODE"]
+                if col in nuts_gdf.columns
+            ),
+            None,
+        )
+        if code_col is None:
+            return self._rasterize_nuts_ids(nuts_gdf, exposition_meta)
+
+        cache_key = (
+            tuple(nuts_gdf[code_col].astype(str)),
+            exposition_meta["height"],
+            exposition_meta["width"],
+            tuple(exposition_meta["transform"])[:6],
+            str(exposition_meta.get("crs")),
         )
+        with self._region_ids_lock:
+            entry_lock = self._region_ids_locks.setdefault(cache_key, threading.Lock())
+        # Indicators on other NUTS levels burn concurrently; only indicators
+        # sharing this frame wait for the first burn
+        with entry_lock:
+            region_ids = self._region_ids_cache.get(cache_key)
+            if region_ids is None:
+                region_ids = self._rasterize_nuts_ids(nuts_gdf, exposition_meta)
+                self._region_ids_cache[cache_key] = region_ids
+            else:
+                logger.info("Reusing rasterized NUTS region identifiers")
+        return region_ids
+
+    def _rasterize_nuts_ids(
+        self, nuts_gdf: gpd.GeoDataFrame, exposition_meta: dict
+    ) -> np.ndarray:
+        """
+        Rasterize all NUTS regions as int32 identifiers (row index + 1, 0=no region).
 
-        if tif_path.exists():
+        No region is filtered by value here; only regions outside the raster
+        extent are left out of the burn.
+        """
+        transform = exposition_meta["transform"]
+        height = exposition_meta["height"]
+        width = exposition_meta["width"]
+        region_geometries = nuts_gdf.geometry.to_numpy()
+
+        # Burn in the exposition grid's CRS. The NUTS frames are normally
+        # already projected on load, so only a mismatch reprojects
+        target_crs = exposition_meta.get("crs")
+        if (
+            target_crs is not None
+            and nuts_gdf.crs is not None
+            and nuts_gdf.crs != target_crs
+        ):
             logger.info(
-                f"Loading existing economic exposition layer for {dataset_name}"
+                f"Reprojecting {len(region_geometries)} NUTS regions to {target_crs}"
+            )
+            region_geometries = (
+                gpd.GeoSeries(region_geometries, crs=nuts_gdf.crs)
+                .to_crs(target_crs)
+                .to_numpy()
+            )
+
+        # Burn region identifiers rather than values so regions sharing the
+        # same economic value remain distinguishable. Regions outside the
+        # raster extent (e.g. overseas territories) are dropped with one
+        # spatial index query; the identifiers of the kept regions are unchanged
+        region_numbers = np.arange(1, len(region_geometries) + 1)
+        raster_bbox = box(*rasterio.transform.array_bounds(height, width, transform))
+        in_extent = gpd.GeoSeries(region_geometries).sindex.query(
+            raster_bbox, predicate="intersects"
+        )
+        # Burn the regions from the top of the raster down (descending upper
+        # bound), so consecutive burns write neighbouring rows of the output
+        in_extent = np.sort(in_extent)
+        in_extent = in_extent[
+            np.argsort(
+                -shapely.bounds(region_geometries[in_extent])[:, 3], kind="stable"
+            )
+        ]
+        if in_extent.size:
+            region_ids = rasterio.features.rasterize(
+                zip(region_geometries[in_extent], region_numbers[in_extent].tolist()),
+                out_shape=(height, width),
+                transform=transform,
+                fill=0,
+                all_touched=False,
+                merge_alg=rasterio.enums.MergeAlg.replace,
+                dtype=np.int32,
             )
-            with rasterio.open(tif_path) as src:
-                return src.read(1).astype(np.float32)
         else:
-            logger.info(f"Creating economic exposition layer for {dataset_name}")
+            logger.warning("No NUTS regions overlap the raster extent")
+            region_ids = np.zeros((height, width), dtype=np.int32)
+        return region_ids
 
-            economic_weights = self.config.economic_exposition_weights
-            if dataset_name not in economic_weights:
-                logger.warning(
-                    f"No specific exposition weights found for {dataset_name}, using default"
+    def _get_economic_exposition_layer(self, dataset_name: str) -> np.ndarray:
+        """Get economic exposition layer for spatial distribution as float32."""
+        tif_path = self._exposition_tif_dir / f"exposition_{dataset_name}.tif"
+
+        economic_weights = self.config.economic_exposition_weights
+        if dataset_name not in economic_weights:
+            if tif_path.exists():
+                logger.info(
+                    f"Loading existing economic exposition layer for {dataset_name}"
                 )
-                default_data, _ = self.exposition_layer.calculate_exposition()
-                return default_data
+                with rasterio.open(tif_path) as src:
+                    return src.read(1, out_dtype=np.float32)
+
+            return self._get_default_exposition(dataset_name)
+
+        # The saved layer is tagged with a key over its weights, inputs and
+        # grid settings, so it is reused only while none of them changed
+        weights = economic_weights[dataset_name]
+        exposition_key = self.exposition_layer.economic_exposition_key(weights)
+        exposition_data = self._read_tagged_exposition(tif_path, exposition_key)
+        if exposition_data is not None:
+            logger.info(
+                f"Loading existing economic exposition layer for {dataset_name}"
+            )
+            return exposition_data
 
-            weights = economic_weights[dataset_name]
+        # The indicators share one ExpositionLayer (and its cache files), so
+        # exposition layers are computed one at a time
+        with self._exposition_lock:
+            exposition_data = self._read_tagged_exposition(tif_path, exposition_key)
+            if exposition_data is not None:
+                return exposition_data
+
+            logger.info(f"Creating economic exposition layer for {dataset_name}")
             exposition_data, meta = (
                 self.exposition_layer.create_economic_exposition_layer(
                     dataset_name, weights
                 )
             )
+            exposition_data = exposition_data.astype(np.float32, copy=False)
 
             tif_path.parent.mkdir(parents=True, exist_ok=True)
             self.exposition_layer.save_exposition_layer(
-                exposition_data, meta, str(tif_path)
+                exposition_data,
+                meta,
+                str(tif_path),
+                tags={"exposition_key": exposition_key},
             )
             logger.info(
                 f"Created and saved economic exposition layer for {dataset_name}"
             )
 
-            return exposition_data
+        return exposition_data
+
+    def _read_tagged_exposition(
+        self, tif_path: Path, exposition_key: str
+    ) -> Optional[np.ndarray]:
+        """Read a saved exposition layer as float32 if its key tag matches."""
+        if not tif_path.exists():
+            return None
+        with rasterio.open(tif_path) as src:
+            if src.tags().get("exposition_key") != exposition_key:
+                logger.info(f"Saved exposition layer {tif_path.name} is outdated")
+                return None
+            return src.read(1, out_dtype=np.float32)
+
+    def _get_default_exposition(self, dataset_name: str) -> np.ndarray:
+        """Get the default exposition layer as float32, computing it once."""
+        with self._exposition_lock:
+            # Warn only for the first indicator falling back to the default;
+            # later ones reuse the layer computed here
+            if self._default_exposition is None:
+                logger.warning(
+                    f"No specific exposition weights found for {dataset_name}, using default"
+                )
+                logger.info("Calculating default exposition layer")
+                default_data, _ = self.exposition_layer.calculate_exposition()
+                self._default_exposition = default_data.astype(np.float32, copy=False)
+            else:
+                logger.debug(f"Using default exposition layer for {dataset_name}")
+            return self._default_exposition
 
     def _load_land_mask(self, exposition_meta: dict) -> np.ndarray:
-        """Load land mask for mass conservation calculations."""
+        """Load land mask for mass conservation calculations, once per target grid."""
+        grid_key = (
+            exposition_meta["height"],
+            exposition_meta["width"],
+            tuple(exposition_meta["transform"])[:6],
+            str(exposition_meta["crs"]),
+        )
+        land_mask = self._land_mask_cache.get(grid_key)
+        if land_mask is None:
+            land_mask = self._read_land_mask(exposition_meta)
+            self._land_mask_cache[grid_key] = land_mask
+        return land_mask
+
+    def _read_land_mask(self, exposition_meta: dict) -> np.ndarray:
+        """Read and reproject the land mask onto the exposition grid."""
         try:
             with rasterio.open(self.config.land_mass_path) as src:
+                # Read directly when the land mass raster is already on the
+                # exposition grid
+                if (
+                    src.height == exposition_meta["height"]
+                    and src.width == exposition_meta["width"]
+                    and src.crs == exposition_meta["crs"]
+                    and src.transform == exposition_meta["transform"]
+                ):
+                    land_mask = (src.read(1) > 0).astype(np.uint8)
+                    logger.info("Loaded aligned land mask without reprojection")
+                    return land_mask
+
                 land_mask, _ = rasterio.warp.reproject(
                     source=src.read(1),
                     destination=np.zeros(
@@ -1096,28 +1818,53 @@ class RelevanceAbsoluteLayer:
         self, relevance_layers: Dict[str, np.ndarray], meta: dict
     ):
         """Save absolute relevance layers to dedicated folder structure."""
-        output_dir = self.config.output_dir / "relevance_absolute"
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        tif_dir = output_dir / "tif"
+        tif_dir = self._relevance_absolute_tif_dir
         tif_dir.mkdir(parents=True, exist_ok=True)
 
         output_meta = meta.copy()
         output_meta.update(
-            {"driver": "GTiff", "dtype": "float32", "count": 1, "nodata": None}
+            {
+                "driver": "GTiff",
+                "dtype": "float32",
+                "count": 1,
+                "nodata": None,
+                # Tiled LZW with the floating point predictor compresses the
+                # smoothly varying distributions and speeds up windowed reads
+                "tiled": True,
+                "blockxsize": 512,
+                "blockysize": 512,
+                "compress": "lzw",
+                "predictor": 3,
+                "BIGTIFF": "IF_SAFER",
+                "num_threads": "ALL_CPUS",
+            }
         )
 
-        for layer_name, data in relevance_layers.items():
+        # Distributed layers are float32 already, so the cast below is a no-op
+        # for them and only converts layers supplied in another dtype
+        output_dtype = np.dtype(output_meta["dtype"])
+
+        def write_layer(layer_name: str, data: np.ndarray):
             output_path = tif_dir / f"absolute_relevance_{layer_name}.tif"
 
             if output_path.exists():
                 output_path.unlink()
 
             with rasterio.open(output_path, "w", **output_meta) as dst:
-                dst.write(data.astype(np.float32), 1)
+                dst.write(data.astype(output_dtype, copy=False), 1)
 
             logger.info(f"Saved absolute {layer_name} relevance layer to {output_path}")
 
+        # GDAL releases the GIL while encoding and writing, so the layers are
+        # written concurrently
+        max_workers = max(1, min(len(relevance_layers), self.config.max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    write_layer, relevance_layers.keys(), relevance_layers.values()
+                )
+            )
+
     def visualize_absolute_relevance_layers(
         self,
         relevance_layers: Dict[str, np.ndarray],
@@ -1125,28 +1872,60 @@ class RelevanceAbsoluteLayer:
         save_plots: bool = True,
     ):
         """Create visualizations for absolute relevance layers using unified styling."""
-        output_dir = self.config.output_dir / "relevance_absolute"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = self._relevance_absolute_dir
 
         logger.info("Creating absolute relevance layer visualizations...")
 
         land_mask = self._load_land_mask(meta)
 
-        for layer_name, data in relevance_layers.items():
-            if save_plots:
-                plot_path = output_dir / f"absolute_relevance_{layer_name}_plot.png"
+        if not save_plots or not relevance_layers:
+            return
 
-                self.visualizer.visualize_relevance_layer(
-                    data=data,
-                    meta=meta,
-                    layer_name=f"absolute_{layer_name}",
-                    output_path=plot_path,
-                    land_mask=land_mask,
-                )
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-                logger.info(
-                    f"Saved absolute {layer_name} relevance visualization to {plot_path}"
+        # Indicator PNGs are independent and CPU-bound, and matplotlib is not
+        # thread-safe, so render them in parallel processes
+        plot_paths = {
+            layer_name: output_dir / f"absolute_relevance_{layer_name}_plot.png"
+            for layer_name in relevance_layers
+        }
+        # The rasters are written once to .npy files that the workers
+        # memory-map, instead of pickling a copy per job, and the workers are
+        # spawned rather than forked from this threaded process
+        max_workers = max(1, min(len(relevance_layers), self.config.max_workers))
+        with tempfile.TemporaryDirectory(
+            prefix=".render_", dir=self.config.output_dir
+        ) as spill_dir:
+            spilled = {}
+            render_jobs = {
+                layer_name: spill_arrays(
+                    dict(
+                        data=data,
+                        meta=meta,
+                        layer_name=f"absolute_{layer_name}",
+                        output_path=plot_paths[layer_name],
+                        land_mask=land_mask,
+                    ),
+                    spill_dir,
+                    spilled,
                 )
+                for layer_name, data in relevance_layers.items()
+            }
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = {
+                    layer_name: executor.submit(
+                        _render_absolute_relevance_png, self.config, render_kwargs
+                    )
+                    for layer_name, render_kwargs in render_jobs.items()
+                }
+                for layer_name, future in futures.items():
+                    future.result()
+                    logger.info(
+                        f"Saved absolute {layer_name} relevance visualization to {plot_paths[layer_name]}"
+                    )
 
     def run_absolute_relevance_analysis(
         self,
@@ -1157,15 +1936,23 @@ class RelevanceAbsoluteLayer:
         """Main execution flow for absolute relevance layer analysis."""
         logger.info("Starting absolute relevance layer analysis with mass conservation")
 
-        absolute_relevance_layers, meta = self.calculate_absolute_relevance(
-            layers_to_generate
-        )
+        try:
+            absolute_relevance_layers, meta = self.calculate_absolute_relevance(
+                layers_to_generate
+            )
 
-        if export_individual_tifs:
-            self.save_absolute_relevance_layers(absolute_relevance_layers, meta)
+            if export_individual_tifs:
+                self.save_absolute_relevance_layers(absolute_relevance_layers, meta)
 
-        if visualize:
-            self.visualize_absolute_relevance_layers(absolute_relevance_layers, meta)
+            if visualize:
+                self.visualize_absolute_relevance_layers(
+                    absolute_relevance_layers, meta
+                )
+        finally:
+            # Spill files are only needed while saving and visualizing. The
+            # returned memory maps stay readable after their files are
+            # unlinked on POSIX systems
+            self._release_spilled_layers()
 
         logger.info("Completed absolute relevance layer analysis")
         return absolute_relevance_layers
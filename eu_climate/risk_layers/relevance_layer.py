@@ -3,6 +3,7 @@ import rasterio.features
 import rasterio.warp
 import geopandas as gpd
 import pandas as pd
+import shapely
 from typing import Tuple, Dict, List
 import numpy as np
 from pathlib import Path
@@ -326,6 +327,8 @@ class NUTSDataMapper:
             config: Project configuration containing paths and spatial parameters
         """
         self.config = config
+        # Projected NUTS frames by level, so repeated runs read each file once
+        self._nuts_gdf_cache = {}
 
     def load_nuts_shapefile(self, nuts_level: str) -> gpd.GeoDataFrame:
         """
@@ -341,6 +344,11 @@ class NUTSDataMapper:
         Returns:
             GeoDataFrame with NUTS boundaries in target coordinate system
         """
+        # Callers get their own copy, so the cached frame is never modified
+        cached_gdf = self._nuts_gdf_cache.get(nuts_level)
+        if cached_gdf is not None:
+            return cached_gdf.copy()
+
         # Get NUTS file path from configuration
         nuts_filename = getattr(self.config, f"nuts_{nuts_level}_file_path", None)
         if nuts_filename is None:
@@ -359,7 +367,8 @@ class NUTSDataMapper:
             logger.info(f"Transformed NUTS shapefile to {target_crs}")
 
         logger.info(f"Loaded {len(nuts_gdf)} NUTS {nuts_level.upper()} regions")
-        return nuts_gdf
+        self._nuts_gdf_cache[nuts_level] = nuts_gdf
+        return nuts_gdf.copy()
 
     def join_economic_data(
         self,
@@ -725,47 +734,69 @@ class EconomicDistributor:
             # Create high-resolution raster for ports
             hr_port_raster = np.zeros(hr_shape, dtype=np.float32)
 
+            # Extract the port columns once and iterate over plain arrays
+            # instead of building a Series per row. Port polygon areas in
+            # square meters come from one vectorized call
+            if (
+                "geometry" in port_freight_data.columns
+                and "freight_value" in port_freight_data.columns
+            ):
+                port_geometries = port_freight_data["geometry"].to_numpy()
+                port_freight_values = port_freight_data["freight_value"].to_numpy()
+                port_areas_m2 = shapely.area(port_geometries)
+            else:
+                port_geometries = port_freight_values = port_areas_m2 = []
+            port_id_col = next(
+                (
+                    col
+                    for col in ["PORT_ID", "port_id"]
+                    if col in port_freight_data.columns
+                ),
+                None,
+            )
+            port_ids = (
+                port_freight_data[port_id_col].to_numpy()
+                if port_id_col is not None
+                else ["unknown"] * len(port_freight_data)
+            )
+
             # Process each port individually to distribute freight over its entire shapefile area
-            for _, row in port_freight_data.iterrows():
-                if "geometry" in row and "freight_value" in row:
-                    # Debug logging for port processing
-                    port_id = row.get("PORT_ID", row.get("port_id", "unknown"))
-                    freight_value = row.get("freight_value", 0)
-                    logger.debug(
-                        f"Processing port {port_id}: freight={freight_value}, geometry_valid={row['geometry'] is not None}"
-                    )
+            for port_id, port_geometry, freight_value, port_area_m2 in zip(
+                port_ids, port_geometries, port_freight_values, port_areas_m2
+            ):
+                # Debug logging for port processing
+                logger.debug(
+                    f"Processing port {port_id}: freight={freight_value}, geometry_valid={port_geometry is not None}"
+                )
 
-                    if freight_value > 0 and row["geometry"] is not None:
-                        # Calculate area of the port polygon in square meters
-                        port_area_m2 = row["geometry"].area
-
-                        if port_area_m2 > 0:
-                            # Calculate freight density per square meter
-                            freight_per_m2 = freight_value / port_area_m2
-
-                            # Calculate freight value per pixel (port_resolution x port_resolution)
-                            pixel_area_m2 = port_resolution * port_resolution
-                            freight_per_pixel = freight_per_m2 * pixel_area_m2
-
-                            # Rasterize this single port with its freight density
-                            single_port_raster = rasterio.features.rasterize(
-                                [(row["geometry"], freight_per_pixel)],
-                                out_shape=hr_shape,
-                                transform=hr_transform,
-                                fill=0,
-                                dtype=np.float32,
-                                merge_alg=rasterio.enums.MergeAlg.add,
-                            )
-
-                            # Add to the combined high-resolution raster
-                            hr_port_raster += single_port_raster
-
-                            logger.debug(
-                                f"Port {port_id}: "
-                                f"area={port_area_m2:,.0f}m², "
-                                f"freight={freight_value:,.0f}, "
-                                f"density={freight_per_pixel:.6f}/pixel"
-                            )
+                if freight_value > 0 and port_geometry is not None:
+                    if port_area_m2 > 0:
+                        # Calculate freight density per square meter
+                        freight_per_m2 = freight_value / port_area_m2
+
+                        # Calculate freight value per pixel (port_resolution x port_resolution)
+                        pixel_area_m2 = port_resolution * port_resolution
+                        freight_per_pixel = freight_per_m2 * pixel_area_m2
+
+                        # Rasterize this single port with its freight density
+                        single_port_raster = rasterio.features.rasterize(
+                            [(port_geometry, freight_per_pixel)],
+                            out_shape=hr_shape,
+                            transform=hr_transform,
+                            fill=0,
+                            dtype=np.float32,
+                            merge_alg=rasterio.enums.MergeAlg.add,
+                        )
+
+                        # Add to the combined high-resolution raster
+                        hr_port_raster += single_port_raster
+
+                        logger.debug(
+                            f"Port {port_id}: "
+                            f"area={port_area_m2:,.0f}m², "
+                            f"freight={freight_value:,.0f}, "
+                            f"density={freight_per_pixel:.6f}/pixel"
+                        )
 
             # Resample high-resolution raster back to target resolution
             from rasterio.warp import reproject, Resampling
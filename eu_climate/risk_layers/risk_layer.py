@@ -7,7 +7,7 @@ from pathlib import Path
 import re
 
 from eu_climate.config.config import ProjectConfig
-from eu_climate.utils.utils import setup_logging
+from eu_climate.utils.utils import read_scaled_band, setup_logging
 from eu_climate.utils.conversion import RasterTransformer
 from eu_climate.utils.visualization import LayerVisualizer
 from eu_climate.utils.caching_wrappers import CacheAwareMethod
@@ -144,7 +144,8 @@ class RiskLayer:
                 )
                 try:
                     with rasterio.open(hazard_file) as src:
-                        hazard_results[scenario.name] = src.read(1)
+                        # Quantized hazard exports are decoded to float risk
+                        hazard_results[scenario.name] = read_scaled_band(src)
                 except Exception as e:
                     logger.warning(
                         f"Failed to load existing hazard file {hazard_file}: {e}"
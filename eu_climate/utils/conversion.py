@@ -461,7 +461,9 @@ class RasterTransformer:
         if transform == reference_transform and data.shape == reference_shape:
             return data
 
-        # Perform alignment reprojection
+        # Perform alignment reprojection. GDAL's warper already processes the
+        # destination in chunks bounded by its warp memory limit, so the
+        # chunks are spread over worker threads rather than iterated here
         destination = np.empty(reference_shape, dtype=np.float32)
         rasterio.warp.reproject(
             source=data,
@@ -471,6 +473,7 @@ class RasterTransformer:
             dst_transform=reference_transform,
             dst_crs=self.target_crs,
             resampling=Resampling[resampling_method.lower()],
+            num_threads=getattr(self.config, "max_workers", 1),
         )
 
         return destination
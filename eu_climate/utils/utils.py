@@ -2,8 +2,11 @@
 import logging
 import os
 import warnings
+import numpy as np
 import rasterio
 import sys
+from pathlib import Path
+from typing import Dict, NamedTuple
 
 
 def setup_logging(name=__name__):
@@ -82,3 +85,77 @@ def suppress_warnings():
 
     # Suppress general user warnings that don't impact functionality
     warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def read_scaled_band(src, band: int = 1):
+    """
+    Read a raster band as float32, applying its scale, offset and nodata.
+
+    Quantized exports (e.g. uint8 flood risk) store values as integer codes
+    with a band scale and offset. Integer bands are decoded to float32 with
+    nodata cells set to NaN; float bands are returned unchanged as float32.
+
+    Args:
+        src: Open rasterio dataset
+        band: Band index to read (1-based)
+
+    Returns:
+        Decoded float32 array
+    """
+    data = src.read(band)
+    if not np.issubdtype(data.dtype, np.integer):
+        return data.astype(np.float32, copy=False)
+
+    nodata_mask = data == src.nodata if src.nodata is not None else None
+    decoded = data.astype(np.float32) * np.float32(src.scales[band - 1])
+    decoded += np.float32(src.offsets[band - 1])
+    if nodata_mask is not None:
+        decoded[nodata_mask] = np.nan
+    return decoded
+
+
+class SpilledArray(NamedTuple):
+    """Reference to an array written to a .npy file for a worker process."""
+
+    path: str
+
+
+def spill_arrays(
+    payload: Dict, spill_dir: Path, spilled: Dict[int, SpilledArray]
+) -> Dict:
+    """
+    Replace the arrays of a worker payload with references to .npy files.
+
+    Worker processes then map the files instead of receiving pickled copies
+    of every raster. Arrays shared by several payloads are written once,
+    tracked by identity in ``spilled``.
+
+    Args:
+        payload: Keyword arguments for the worker
+        spill_dir: Directory the .npy files are written to
+        spilled: Arrays already written, keyed by id(); updated in place
+
+    Returns:
+        Payload with every array replaced by a SpilledArray reference
+    """
+    result = {}
+    for key, value in payload.items():
+        if isinstance(value, np.ndarray):
+            reference = spilled.get(id(value))
+            if reference is None:
+                path = Path(spill_dir) / f"array_{len(spilled)}.npy"
+                np.save(path, value)
+                reference = spilled[id(value)] = SpilledArray(str(path))
+            value = reference
+        result[key] = value
+    return result
+
+
+def load_spilled_arrays(payload: Dict) -> Dict:
+    """Replace SpilledArray references with copy-on-write memory maps."""
+    return {
+        key: np.load(value.path, mmap_mode="c")
+        if isinstance(value, SpilledArray)
+        else value
+        for key, value in payload.items()
+    }
@@ -54,7 +54,7 @@ Usage:
 """
 
 from pathlib import Path
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 import numpy as np
 import rasterio
 import geopandas as gpd
@@ -111,6 +111,7 @@ class WebExportMixin:
         output_path: Union[str, Path],
         layer_name: str,
         create_web_formats: bool = True,
+        tags: Optional[Dict[str, str]] = None,
     ) -> Dict[str, bool]:
         """
         Save raster data in both legacy format and web-optimized formats.
@@ -124,6 +125,7 @@ class WebExportMixin:
             output_path: Path for legacy GeoTIFF output
             layer_name: Layer name for metadata and web export naming
             create_web_formats: Whether to create web-optimized formats (COG)
+            tags: Optional additional GeoTIFF tags
 
         Returns:
             Dict[str, bool]: Success status for each format:
@@ -175,7 +177,9 @@ class WebExportMixin:
             with rasterio.open(output_path, "w", **output_meta) as dst:
                 dst.write(data.astype(np.float32), 1)
                 dst.set_band_description(1, layer_name)
-                dst.update_tags(layer=layer_name, created_by="eu_climate")
+                dst.update_tags(
+                    layer=layer_name, created_by="eu_climate", **(tags or {})
+                )
 
             results["geotiff"] = True
             logger.info(f"Saved legacy GeoTIFF: {output_path}")
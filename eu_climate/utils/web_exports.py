@@ -68,6 +68,7 @@ Usage:
 """
 
 import os
+import shutil
 import subprocess
 import tempfile
 import sqlite3
@@ -76,6 +77,7 @@ from pathlib import Path
 from typing import Dict, Optional, Union, List
 
 try:
+    import numpy as np
     import rasterio
     from rasterio.crs import CRS
 
@@ -357,7 +359,17 @@ class WebOptimizedExporter:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        decoded_dir = None
         try:
+            # Quantized rasters (integer codes with a band scale/offset) are
+            # published as decoded float values, since web clients read the
+            # raw band values
+            if self._is_scaled_raster(input_path):
+                decoded_dir = tempfile.mkdtemp(prefix="eu_climate_cog_")
+                decoded_path = Path(decoded_dir) / input_path.name
+                self._write_unscaled_copy(input_path, decoded_path)
+                input_path = decoded_path
+
             # Prefer rio-cogeo; fall back to gdal_translate if not available
             if not COG_TRANSLATE_AVAILABLE:
                 logger.warning(
@@ -423,6 +435,33 @@ class WebOptimizedExporter:
         except Exception as e:
             logger.error(f"Failed to create COG {output_path}: {e}")
             return False
+        finally:
+            if decoded_dir is not None:
+                shutil.rmtree(decoded_dir, ignore_errors=True)
+
+    def _is_scaled_raster(self, input_path: Path) -> bool:
+        """Check whether the first band stores integer codes with a scale/offset."""
+        with rasterio.open(input_path) as src:
+            return np.issubdtype(np.dtype(src.dtypes[0]), np.integer) and (
+                src.scales[0] != 1.0 or src.offsets[0] != 0.0
+            )
+
+    def _write_unscaled_copy(self, input_path: Path, output_path: Path) -> None:
+        """Write a float32 copy of a scaled integer raster, nodata set to NaN."""
+        with rasterio.open(input_path) as src:
+            profile = src.profile.copy()
+            profile.update(dtype="float32", nodata=float("nan"))
+            profile.pop("predictor", None)
+            scale = np.float32(src.scales[0])
+            offset = np.float32(src.offsets[0])
+            with rasterio.open(output_path, "w", **profile) as dst:
+                for _, window in src.block_windows(1):
+                    codes = src.read(1, window=window, masked=True)
+                    values = codes.astype(np.float32) * scale + offset
+                    dst.write(values.filled(np.nan), 1, window=window)
+                dst.update_tags(**src.tags())
+                if src.descriptions[0]:
+                    dst.set_band_description(1, src.descriptions[0])
 
     def _validate_cog(self, cog_path: Path) -> bool:
         """Validate that the file is a proper COG."""
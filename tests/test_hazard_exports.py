@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import numpy as np
+from rasterio.crs import CRS
+from rasterio.transform import Affine
+
+from eu_climate.risk_layers.economic_impact_analyzer import EconomicImpactAnalyzer
+from eu_climate.risk_layers.hazard_layer import HAZARD_EXPORT_LEVELS, HazardLayer
+
+
+def _export_scenario(tmp_path, flood_risk, quantize):
+    config = SimpleNamespace(
+        output_dir=tmp_path,
+        quantize_hazard_exports=quantize,
+        max_safe_flood_risk=0.3,
+        config={"relevance": {"economic_variables": ["gdp"]}},
+    )
+    hazard_layer = HazardLayer.__new__(HazardLayer)
+    hazard_layer.config = config
+    hazard_layer.river_polygon_network = None
+    # PNG rendering is not under test
+    hazard_layer.visualizer = SimpleNamespace(
+        visualize_hazard_scenario=lambda **kwargs: None
+    )
+    hazard_layer._export_individual_scenario(
+        "Current",
+        {
+            "flood_risk": flood_risk,
+            "transform": Affine(30.0, 0.0, 0.0, 0.0, -30.0, 300.0),
+            "crs": CRS.from_epsg(3035),
+            "scenario": SimpleNamespace(name="Current", rise_meters=0.0),
+            "dem_data": np.zeros_like(flood_risk),
+            "coastline_zone_mask": None,
+        },
+        np.ones(flood_risk.shape, dtype=np.uint8),
+    )
+    return EconomicImpactAnalyzer(config)
+
+
+def _sample_risk():
+    rng = np.random.default_rng(0)
+    flood_risk = rng.random((10, 10), dtype=np.float32)
+    flood_risk[0, :3] = np.nan
+    return flood_risk
+
+
+def test_quantized_export_is_decoded_by_economic_impact_analyzer(tmp_path):
+    flood_risk = _sample_risk()
+    analyzer = _export_scenario(tmp_path, flood_risk, quantize=True)
+
+    hazard_data, meta = analyzer.load_hazard_scenario("Current")
+
+    assert meta["dtype"] == "uint8"
+    assert hazard_data.dtype == np.float32
+    np.testing.assert_array_equal(np.isnan(hazard_data), np.isnan(flood_risk))
+    valid = ~np.isnan(flood_risk)
+    assert np.nanmax(np.abs(hazard_data[valid] - flood_risk[valid])) <= (
+        0.5 / HAZARD_EXPORT_LEVELS + 1e-6
+    )
+    # Decoded risk is compared against the threshold, not the integer codes
+    away_from_threshold = valid & (
+        np.abs(flood_risk - analyzer.max_safe_flood_risk) > 1.0 / HAZARD_EXPORT_LEVELS
+    )
+    np.testing.assert_array_equal(
+        hazard_data[away_from_threshold] > analyzer.max_safe_flood_risk,
+        flood_risk[away_from_threshold] > analyzer.max_safe_flood_risk,
+    )
+
+
+def test_float_export_round_trips_exactly(tmp_path):
+    flood_risk = _sample_risk()
+    analyzer = _export_scenario(tmp_path, flood_risk, quantize=False)
+
+    hazard_data, meta = analyzer.load_hazard_scenario("Current")
+
+    assert meta["dtype"] == "float32"
+    np.testing.assert_array_equal(hazard_data, flood_risk)